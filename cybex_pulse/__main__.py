@@ -160,7 +160,7 @@ def main():
         
         if last_modified:
             from datetime import datetime
-            modified_date = datetime.fromtimestamp(last_modified).strftime('%Y-%m-%d %H:%M:%S')
+            modified_date = datetime.fromtimestamp(last_modified / 1e9).strftime('%Y-%m-%d %H:%M:%S')
             logger.info("Version last updated: %s", modified_date)
         
         if is_dev:
@@ -80,7 +80,7 @@ class ThreadManager:
                 self.debug.start_timer(f"thread_{name}")
                 
                 try:
-                    with self.thread_pool_lock:
+                    with self.debug.debug_lock(self.thread_pool_lock, "thread_pool_lock"):
                         self.active_thread_count += 1
                         
                     if self.debug:
@@ -89,7 +89,7 @@ class ThreadManager:
                     # Call the original target function
                     return target(*target_args)
                 finally:
-                    with self.thread_pool_lock:
+                    with self.debug.debug_lock(self.thread_pool_lock, "thread_pool_lock"):
                         self.active_thread_count -= 1
                         
                     if self.debug:
@@ -330,9 +330,6 @@ class ThreadManager:
         thread_id = thread.ident
         
         with self.deadlock_check_lock:
-            # Log lock acquisition attempt
-            self.debug.log_lock_info(lock, lock_name, acquiring=True)
-            
             # Check if this thread already holds locks
             if thread_id in self.thread_locks:
                 # Add this lock to the thread's held locks
@@ -360,9 +357,6 @@ class ThreadManager:
         thread_id = thread.ident
         
         with self.deadlock_check_lock:
-            # Log lock release
-            self.debug.log_lock_info(lock, lock_name, acquiring=False)
-            
             # Remove this lock from the thread's held locks
             if thread_id in self.thread_locks:
                 self.thread_locks[thread_id].discard(lock_name)
@@ -465,17 +459,18 @@ class ThreadManager:
         if not self.debug or not self.debug.is_debug_enabled():
             return
             
-        current_time = time.time()
+        current_time = time.monotonic()
         leaked_resources = []
         
-        # Use the debug logger's resource trackers
-        for resource_name, info in self.debug._resource_trackers.items():
-            elapsed = current_time - info['time']
+        # Use the debug logger's resource trackers; garbage collected resources
+        # can't have leaked and aren't included
+        for resource_name, entry in self.debug.tracked_resources():
+            elapsed = current_time - entry.time
             if elapsed > timeout_seconds:
                 leaked_resources.append({
                     'name': resource_name,
                     'elapsed_time': elapsed,
-                    'thread': info['thread']
+                    'thread': entry.thread
                 })
                 
         if leaked_resources:
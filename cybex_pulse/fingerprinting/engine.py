@@ -119,7 +119,9 @@ class FingerprintEngine:
         
         Args:
             device_data: Dictionary containing device attributes like MAC, open ports,
-                        HTTP headers, SNMP data, etc.
+                        HTTP headers, SNMP data, etc. Treated as read-only: neither
+                        the dict nor its nested values are modified, so callers can
+                        pass shared data without making a defensive copy.
         
         Returns:
             List of potential device matches with confidence scores
@@ -0,0 +1,28 @@
+"""
+Helpers for building device fingerprinting test data.
+"""
+from typing import Any, Dict
+
+
+def make_device_data(mac_address: str, **overrides: Any) -> Dict[str, Any]:
+    """
+    Build mock device data with empty defaults for every scan attribute.
+    
+    Args:
+        mac_address: MAC address of the mock device
+        **overrides: Attributes to set instead of the defaults (ip_address,
+                     open_ports, http_headers, snmp_data, mdns_data, ...)
+    
+    Returns:
+        Dictionary in the shape expected by FingerprintEngine.identify_device
+    """
+    device_data = {
+        'ip_address': '192.168.1.1',
+        'open_ports': [],
+        'http_headers': {},
+        'snmp_data': {},
+        'mdns_data': {}
+    }
+    device_data.update(overrides)
+    device_data['mac_address'] = mac_address
+    return device_data
@@ -3,6 +3,7 @@ Tests for Synology device signatures.
 """
 import pytest
 from cybex_pulse.fingerprinting.engine import FingerprintEngine
+from cybex_pulse.fingerprinting.tests.helpers import make_device_data
 from cybex_pulse.fingerprinting.devices.synology import SIGNATURES
 
 
@@ -45,24 +46,24 @@ def test_generic_synology_identification():
     engine = FingerprintEngine()
     
     # Create a mock generic Synology NAS
-    generic_data = {
-        'ip_address': '192.168.1.2',
-        'mac_address': '00:11:32:AA:BB:CC',  # Synology MAC
-        'open_ports': [22, 80, 443, 5000, 5001, 139, 445],
-        'http_headers': {
+    generic_data = make_device_data(
+        '00:11:32:AA:BB:CC',  # Synology MAC
+        ip_address='192.168.1.2',
+        open_ports=[22, 80, 443, 5000, 5001, 139, 445],
+        http_headers={
             'Server': 'nginx',
             'X-Powered-By': 'PHP/7.3.19',
             'Set-Cookie': 'id=123456789',
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'Linux DiskStation 4.4.59+ #42962',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.8072.3.2.10',
         },
-        'mdns_data': {
+        mdns_data={
             'service_type': '_http._tcp',
             'service_name': 'DiskStation'
         }
-    }
+    )
     
     matches = engine.identify_device(generic_data)
     
@@ -82,21 +83,19 @@ def test_synology_router_identification():
     engine = FingerprintEngine()
     
     # Create a mock Synology router
-    router_data = {
-        'ip_address': '192.168.1.1',
-        'mac_address': '00:11:32:DD:EE:FF',  # Synology MAC
-        'open_ports': [22, 80, 443],
-        'http_headers': {
+    router_data = make_device_data(
+        '00:11:32:DD:EE:FF',  # Synology MAC
+        open_ports=[22, 80, 443],
+        http_headers={
             'Server': 'nginx',
             'X-Powered-By': 'PHP/7.3',
             'Set-Cookie': 'id=123456789',
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'RT6600ax Router',
             'SNMPv2-MIB::sysObjectID.0': 'Synology Inc.',
-        },
-        'mdns_data': {}
-    }
+        }
+    )
     
     matches = engine.identify_device(router_data)
     
@@ -116,24 +115,24 @@ def test_specific_nas_model_identification():
     engine = FingerprintEngine()
     
     # Create data for RS1221+ model
-    rs1221_data = {
-        'ip_address': '192.168.1.3',
-        'mac_address': '00:11:32:11:22:33',  # Synology MAC
-        'open_ports': [22, 80, 443, 5000, 5001, 139, 445],
-        'http_headers': {
+    rs1221_data = make_device_data(
+        '00:11:32:11:22:33',  # Synology MAC
+        ip_address='192.168.1.3',
+        open_ports=[22, 80, 443, 5000, 5001, 139, 445],
+        http_headers={
             'Server': 'nginx',
             'X-Powered-By': 'PHP/7.4',
             'Set-Cookie': 'id=123456789',
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'Linux RS1221+ 4.4.180+ #42218',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.8072.3.2.10',
         },
-        'mdns_data': {
+        mdns_data={
             'service_type': '_http._tcp',
             'service_name': 'RS1221+'
         }
-    }
+    )
     
     matches = engine.identify_device(rs1221_data)
     
@@ -153,14 +152,11 @@ def test_partial_synology_match():
     engine = FingerprintEngine()
     
     # Only Synology MAC and a few ports
-    partial_data = {
-        'ip_address': '192.168.1.4',
-        'mac_address': '00:11:32:AA:BB:CC',  # Synology MAC
-        'open_ports': [80, 443, 5000],
-        'http_headers': {},
-        'snmp_data': {},
-        'mdns_data': {}
-    }
+    partial_data = make_device_data(
+        '00:11:32:AA:BB:CC',  # Synology MAC
+        ip_address='192.168.1.4',
+        open_ports=[80, 443, 5000]
+    )
     
     matches = engine.identify_device(partial_data)
     
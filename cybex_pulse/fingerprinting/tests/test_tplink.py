@@ -3,6 +3,7 @@ Tests for TP-Link device signatures.
 """
 import pytest
 from cybex_pulse.fingerprinting.engine import FingerprintEngine
+from cybex_pulse.fingerprinting.tests.helpers import make_device_data
 from cybex_pulse.fingerprinting.devices.tplink import SIGNATURES
 
 
@@ -26,69 +27,68 @@ def test_tplink_signatures_structure():
 @pytest.fixture
 def tplink_archer_device_data():
     """Mock device data for a TP-Link Archer router."""
-    return {
-        'ip_address': '192.168.0.1',
-        'mac_address': '94:D9:B3:12:34:56',
-        'open_ports': [80, 443],
-        'http_headers': {
+    return make_device_data(
+        '94:D9:B3:12:34:56',
+        ip_address='192.168.0.1',
+        open_ports=[80, 443],
+        http_headers={
             'Server': 'TP-LINK Router',
             'WWW-Authenticate': 'Basic realm="TP-LINK Archer C7"',
             'Content-Type': 'text/html',
             'Connection': 'close'
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'TP-LINK Archer C7 AC1750 Wireless Router',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.11863',
             'SNMPv2-MIB::sysName.0': 'Archer C7'
         },
-        'mdns_data': {
+        mdns_data={
             'service_type': '_http._tcp',
             'service_name': 'TP-LINK-ARCHER-C7'
         }
-    }
+    )
 
 
 @pytest.fixture
 def tplink_eap_device_data():
     """Mock device data for a TP-Link EAP access point."""
-    return {
-        'ip_address': '192.168.0.100',
-        'mac_address': '18:A6:F7:AB:CD:EF',
-        'open_ports': [22, 80, 443, 8043],
-        'http_headers': {
+    return make_device_data(
+        '18:A6:F7:AB:CD:EF',
+        ip_address='192.168.0.100',
+        open_ports=[22, 80, 443, 8043],
+        http_headers={
             'Server': 'TP-LINK EAP',
             'Content-Type': 'text/html',
             'Connection': 'keep-alive'
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'TP-LINK EAP225 AC1350 Wireless Access Point',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.11863',
             'SNMPv2-MIB::sysName.0': 'EAP225'
         },
-        'mdns_data': {
+        mdns_data={
             'service_type': '_http._tcp',
             'service_name': 'EAP225'
         }
-    }
+    )
 
 
 @pytest.fixture
 def tplink_kasa_device_data():
     """Mock device data for a TP-Link Kasa smart device."""
-    return {
-        'ip_address': '192.168.0.200',
-        'mac_address': '50:C7:BF:11:22:33',
-        'open_ports': [80, 9999],
-        'http_headers': {
+    return make_device_data(
+        '50:C7:BF:11:22:33',
+        ip_address='192.168.0.200',
+        open_ports=[80, 9999],
+        http_headers={
             'Server': 'TP-LINK Kasa Smart Plug',
             'Content-Type': 'application/json',
         },
-        'snmp_data': {},
-        'mdns_data': {
+        mdns_data={
             'service_type': '_http._tcp',
             'service_name': 'Kasa-Smart-Plug'
         }
-    }
+    )
 
 
 def test_archer_identification(tplink_archer_device_data):
@@ -147,14 +147,11 @@ def test_partial_tplink_matches():
     engine = FingerprintEngine()
     
     # Device with only TP-Link MAC address
-    mac_only = {
-        'ip_address': '192.168.0.50',
-        'mac_address': '14:CC:20:11:22:33',  # TP-Link MAC
-        'open_ports': [80, 443],
-        'http_headers': {},
-        'snmp_data': {},
-        'mdns_data': {}
-    }
+    mac_only = make_device_data(
+        '14:CC:20:11:22:33',  # TP-Link MAC
+        ip_address='192.168.0.50',
+        open_ports=[80, 443]
+    )
     
     matches = engine.identify_device(mac_only)
     
@@ -171,21 +168,20 @@ def test_negative_identification():
     engine = FingerprintEngine()
     
     # Device that is clearly not TP-Link
-    non_tplink_device = {
-        'ip_address': '192.168.0.60',
-        'mac_address': '00:14:6C:11:22:33',  # Netgear MAC
-        'open_ports': [80, 443],
-        'http_headers': {
+    non_tplink_device = make_device_data(
+        '00:14:6C:11:22:33',  # Netgear MAC
+        ip_address='192.168.0.60',
+        open_ports=[80, 443],
+        http_headers={
             'Server': 'Netgear R7000',
             'WWW-Authenticate': 'Basic realm="NETGEAR R7000"',
             'Content-Type': 'text/html'
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'NETGEAR Nighthawk Router',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.4526'
-        },
-        'mdns_data': {}
-    }
+        }
+    )
     
     matches = engine.identify_device(non_tplink_device)
     
@@ -3,6 +3,7 @@ Tests for UniFi device signatures.
 """
 import pytest
 from cybex_pulse.fingerprinting.engine import FingerprintEngine
+from cybex_pulse.fingerprinting.tests.helpers import make_device_data
 from cybex_pulse.fingerprinting.devices.unifi import SIGNATURES
 
 
@@ -28,8 +29,11 @@ def test_udm_identification(unifi_udm_device_data):
     engine = FingerprintEngine()
     
     # Create a modified version that precisely matches a UDM Pro
-    udm_pro_data = unifi_udm_device_data.copy()
-    udm_pro_data['snmp_data']['SNMPv2-MIB::sysDescr.0'] = 'UniFi Dream Machine Pro v1.0.4'
+    udm_pro_data = unifi_udm_device_data | {
+        'snmp_data': unifi_udm_device_data['snmp_data'] | {
+            'SNMPv2-MIB::sysDescr.0': 'UniFi Dream Machine Pro v1.0.4'
+        }
+    }
     
     matches = engine.identify_device(udm_pro_data)
     
@@ -48,21 +52,19 @@ def test_usg_identification():
     engine = FingerprintEngine()
     
     # Create a mock USG device
-    usg_data = {
-        'ip_address': '192.168.1.1',
-        'mac_address': 'FC:EC:DA:11:22:33',  # UniFi MAC
-        'open_ports': [22, 80, 443, 8080, 8443],
-        'http_headers': {
+    usg_data = make_device_data(
+        'FC:EC:DA:11:22:33',  # UniFi MAC
+        open_ports=[22, 80, 443, 8080, 8443],
+        http_headers={
             'Server': 'lighttpd',
             'Content-Type': 'text/html',
             'Connection': 'keep-alive'
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'USG-PRO-4 Linux',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.41112'
-        },
-        'mdns_data': {}
-    }
+        }
+    )
     
     matches = engine.identify_device(usg_data)
     
@@ -81,23 +83,23 @@ def test_unifi_ap_identification():
     engine = FingerprintEngine()
     
     # Create a mock UniFi AP device
-    ap_data = {
-        'ip_address': '192.168.1.5',
-        'mac_address': '80:2A:A8:44:55:66',  # UniFi AP MAC
-        'open_ports': [22, 80, 443],
-        'http_headers': {
+    ap_data = make_device_data(
+        '80:2A:A8:44:55:66',  # UniFi AP MAC
+        ip_address='192.168.1.5',
+        open_ports=[22, 80, 443],
+        http_headers={
             'Server': 'UniFi',
             'Content-Type': 'text/html',
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'UAP-AC-PRO Linux',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.41112'
         },
-        'mdns_data': {
+        mdns_data={
             'service_type': '_ubnt._tcp',
             'service_name': 'UAP-AC-PRO'
         }
-    }
+    )
     
     matches = engine.identify_device(ap_data)
     
@@ -117,20 +119,19 @@ def test_unifi_switch_identification():
     engine = FingerprintEngine()
     
     # Create a mock UniFi Switch device
-    switch_data = {
-        'ip_address': '192.168.1.6',
-        'mac_address': '74:83:C2:77:88:99',  # UniFi Switch MAC
-        'open_ports': [22, 80, 443, 161],
-        'http_headers': {
+    switch_data = make_device_data(
+        '74:83:C2:77:88:99',  # UniFi Switch MAC
+        ip_address='192.168.1.6',
+        open_ports=[22, 80, 443, 161],
+        http_headers={
             'Server': 'UniFi',
             'Content-Type': 'text/html',
         },
-        'snmp_data': {
+        snmp_data={
             'SNMPv2-MIB::sysDescr.0': 'UniFi Switch 24 PoE',
             'SNMPv2-MIB::sysObjectID.0': '1.3.6.1.4.1.41112'
-        },
-        'mdns_data': {}
-    }
+        }
+    )
     
     matches = engine.identify_device(switch_data)
     
@@ -150,14 +151,10 @@ def test_partial_unifi_matches():
     engine = FingerprintEngine()
     
     # Device with only UniFi MAC address
-    mac_only = {
-        'ip_address': '192.168.1.10',
-        'mac_address': 'FC:EC:DA:11:22:33',  # UniFi MAC
-        'open_ports': [],
-        'http_headers': {},
-        'snmp_data': {},
-        'mdns_data': {}
-    }
+    mac_only = make_device_data(
+        'FC:EC:DA:11:22:33',  # UniFi MAC
+        ip_address='192.168.1.10'
+    )
     
     matches = engine.identify_device(mac_only)
     
@@ -20,7 +20,7 @@ def main():
     
     if last_modified:
         # Convert timestamp to human-readable date
-        modified_date = datetime.fromtimestamp(last_modified).strftime('%Y-%m-%d %H:%M:%S')
+        modified_date = datetime.fromtimestamp(last_modified / 1e9).strftime('%Y-%m-%d %H:%M:%S')
         print(f"Last updated: {modified_date}")
     
     if is_dev:
@@ -5,15 +5,25 @@ Set up Git hooks for automatic versioning.
 This script installs Git hooks that automatically update the version
 when commits are made.
 """
+import contextlib
+import functools
 import os
 import stat
 import shutil
 import subprocess
+import sys
 import re
 from pathlib import Path
 
+# Matches plain x.y.z and x.y.z-dev versions
+_VERSION_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-dev)?$')
+
+@functools.lru_cache(maxsize=1)
 def get_git_root():
-    """Get the root directory of the Git repository."""
+    """Get the root directory of the Git repository.
+    
+    The result is cached so repeated calls don't spawn another git process.
+    """
     try:
         result = subprocess.run(
             ['git', 'rev-parse', '--show-toplevel'],
@@ -38,6 +48,12 @@ def increment_version(version_str):
     Returns:
         str: Updated version string
     """
+    # Fast path for well-formed versions
+    match = _VERSION_RE.match(version_str)
+    if match:
+        major, minor, patch = match.groups()
+        return f"{major}.{minor}.{int(patch) + 1}-dev"
+    
     # Parse the current version
     version_parts = version_str.split('.')
     
@@ -73,9 +89,15 @@ def increment_version(version_str):
     # Return the updated version
     return '.'.join(version_parts)
 
-def update_version_file():
-    """Update the VERSION file with an incremented version number."""
-    git_root = get_git_root()
+def update_version_file(git_root=None):
+    """Update the VERSION file with an incremented version number.
+    
+    Args:
+        git_root: Repository root, if already known (the post-commit hook
+                  passes it in so we don't have to ask git again)
+    """
+    if git_root is None:
+        git_root = get_git_root()
     version_file = os.path.join(git_root, "VERSION")
     
     # Read current version
@@ -89,16 +111,68 @@ def update_version_file():
     # Increment version
     new_version = increment_version(current_version)
     
-    # Write updated version
+    # Nothing to write if the version did not change
+    if new_version == current_version:
+        return True
+    
+    # Write updated version atomically so a crash mid-hook can't leave a truncated file
+    tmp_file = version_file + ".tmp"
     try:
-        with open(version_file, 'w') as f:
-            f.write(new_version)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, new_version.encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, version_file)
         print(f"Updated version from {current_version} to {new_version}")
         return True
-    except IOError:
+    except OSError:
+        # Don't leave the partial file behind for git to pick up
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_file)
         print(f"Error: Could not write to VERSION file at {version_file}")
         return False
 
+def _write_if_changed(path, content):
+    """Write an executable hook script, skipping the write if it is already up to date.
+    
+    The file is written to a temporary path and moved into place with
+    os.replace, so git never sees a partially written hook.
+    
+    Args:
+        path: Path of the hook file
+        content: Script content
+        
+    Returns:
+        bool: True if the file was written, False if it was already current,
+              None if it couldn't be written
+    """
+    exec_bits = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content and os.stat(path).st_mode & exec_bits == exec_bits:
+                return False
+    except (IOError, FileNotFoundError):
+        pass
+    
+    tmp_path = path + ".tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
+        os.chmod(tmp_path, os.stat(tmp_path).st_mode | exec_bits)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        # Don't leave the partial hook behind in .git/hooks
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        print(f"Error: Could not write hook at {path}")
+        return None
+
 def create_post_commit_hook():
     """Create a post-commit hook that updates the version."""
     git_root = get_git_root()
@@ -117,17 +191,15 @@ echo "Updating version after commit..."
 # Get the root directory of the Git repository
 REPO_ROOT=$(git rev-parse --show-toplevel)
 # Run the version update script
-python $REPO_ROOT/cybex_pulse/setup_git_hooks.py --update-version
+python "$REPO_ROOT/cybex_pulse/setup_git_hooks.py" --update-version "$REPO_ROOT"
 """
     
-    # Write the post-commit hook
-    with open(post_commit_path, 'w') as f:
-        f.write(post_commit_content)
-    
-    # Make the hook executable
-    os.chmod(post_commit_path, os.stat(post_commit_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    
-    print(f"Created post-commit hook at {post_commit_path}")
+    # Write the post-commit hook and make it executable
+    written = _write_if_changed(post_commit_path, post_commit_content)
+    if written:
+        print(f"Created post-commit hook at {post_commit_path}")
+    elif written is False:
+        print(f"Post-commit hook at {post_commit_path} is up to date")
 
 def create_pre_push_hook():
     """Create a pre-push hook that ensures the version is up to date."""
@@ -150,20 +222,18 @@ REPO_ROOT=$(git rev-parse --show-toplevel)
 # This allows pushing even if the VERSION file has been updated
 """
     
-    # Write the pre-push hook
-    with open(pre_push_path, 'w') as f:
-        f.write(pre_push_content)
-    
-    # Make the hook executable
-    os.chmod(pre_push_path, os.stat(pre_push_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    
-    print(f"Created pre-push hook at {pre_push_path}")
+    # Write the pre-push hook and make it executable
+    written = _write_if_changed(pre_push_path, pre_push_content)
+    if written:
+        print(f"Created pre-push hook at {pre_push_path}")
+    elif written is False:
+        print(f"Pre-push hook at {pre_push_path} is up to date")
 
 def main():
     """Main function to set up Git hooks."""
     # Check if we're just updating the version
-    if len(os.sys.argv) > 1 and os.sys.argv[1] == "--update-version":
-        update_version_file()
+    if len(sys.argv) > 1 and sys.argv[1] == "--update-version":
+        update_version_file(sys.argv[2] if len(sys.argv) > 2 else None)
         return
     
     print("Setting up Git hooks for automatic versioning...")
@@ -6,15 +6,129 @@ to offload logging operations to a dedicated thread, preventing lock contention
 multi-threaded environments.
 """
 import atexit
+import collections
 import logging
 import logging.handlers
 import queue
+import sys
 import threading
+import time
+import traceback
 from typing import Dict, List, Optional, Any, Union
 
 # Constants
 DEFAULT_QUEUE_SIZE = 10000  # Maximum number of log records in queue
 QUEUE_TIMEOUT = 0.1  # Timeout for queue operations in seconds
+CONSOLE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"  # Timestamp format for console messages
+
+# Console message type and error flag for the standard log levels
+_LEVEL_TABLE = {
+    logging.CRITICAL: ("error", True),
+    logging.ERROR: ("error", True),
+    logging.WARNING: ("warning", False),
+    logging.INFO: ("info", False),
+    logging.DEBUG: ("info", False),
+}
+
+
+class _SyncFallbackQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that dispatches records synchronously when the queue is full.
+    
+    Used for the application loggers so that a burst of records (such as debug
+    logging from many threads) slows the callers down instead of being lost.
+    """
+    
+    def __init__(self, log_queue):
+        """
+        Initialize the handler.
+        
+        Args:
+            log_queue: Bounded queue to put log records on
+        """
+        super().__init__(log_queue)
+        self.listener = None
+    
+    def enqueue(self, record):
+        """
+        Put a record on the queue, or hand it to the listener's handlers directly if the queue is full.
+        
+        Args:
+            record: Log record to enqueue
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.listener is None:
+                raise
+            self.listener.handle(record)
+
+
+class _DropOnFullQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that drops records instead of blocking or erroring when the queue is full.
+    
+    Used for Werkzeug so a stalled log listener can never hold up request threads.
+    """
+    
+    def __init__(self, log_queue):
+        """
+        Initialize the handler.
+        
+        Args:
+            log_queue: Bounded queue to put log records on
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        """
+        Put a record on the queue, counting it as dropped if the queue is full.
+        
+        Args:
+            record: Log record to enqueue
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DropReportingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that reports records dropped by a _DropOnFullQueueHandler."""
+    
+    def __init__(self, log_queue, queue_handler, *handlers, respect_handler_level=False):
+        """
+        Initialize the listener.
+        
+        Args:
+            log_queue: Queue to consume log records from
+            queue_handler: The _DropOnFullQueueHandler feeding the queue
+            *handlers: Handlers to dispatch records to
+            respect_handler_level: Whether to honour each handler's level
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.queue_handler = queue_handler
+        self._reported_drops = 0
+    
+    def handle(self, record):
+        """
+        Dispatch a record, first reporting any records dropped since the last report.
+        
+        Args:
+            record: Log record to dispatch
+        """
+        dropped = self.queue_handler.dropped
+        if dropped != self._reported_drops:
+            super().handle(logging.makeLogRecord({
+                "name": record.name,
+                "levelno": logging.WARNING,
+                "levelname": logging.getLevelName(logging.WARNING),
+                "msg": "Dropped %d log records because the log queue was full",
+                "args": (dropped - self._reported_drops,),
+            }))
+            self._reported_drops = dropped
+        super().handle(record)
 
 
 class AsyncLogManager:
@@ -45,10 +159,12 @@ class AsyncLogManager:
         self.log_queue = queue.Queue(maxsize=DEFAULT_QUEUE_SIZE)
         self.listener = None
         self.queue_handler = None
+        self.werkzeug_queue = None
         self.werkzeug_queue_handler = None
         self.is_setup = False
         self.original_handlers = {}
         self.werkzeug_logger_patched = False
+        self._min_level = logging.NOTSET
     
     def setup_async_logging(self, loggers: List[Union[str, logging.Logger]] = None) -> None:
         """
@@ -65,7 +181,7 @@ class AsyncLogManager:
                 
             try:
                 # Create a QueueHandler that sends log records to the queue
-                self.queue_handler = logging.handlers.QueueHandler(self.log_queue)
+                self.queue_handler = _SyncFallbackQueueHandler(self.log_queue)
                 
                 # Get the loggers to set up
                 logger_objects = []
@@ -91,19 +207,22 @@ class AsyncLogManager:
                     logger.addHandler(self.queue_handler)
                 
                 # Create a listener that consumes log records from the queue
-                # and dispatches them to the original handlers
-                handlers = []
-                for logger_handlers in self.original_handlers.values():
-                    handlers.extend(logger_handlers)
-                    
-                # Remove duplicates while preserving order
-                unique_handlers = []
-                handler_ids = set()
-                for handler in handlers:
-                    handler_id = id(handler)
-                    if handler_id not in handler_ids:
-                        handler_ids.add(handler_id)
-                        unique_handlers.append(handler)
+                # and dispatches them to the original handlers, removing
+                # duplicates in one pass while preserving order
+                unique_handlers = list({
+                    id(handler): handler
+                    for logger_handlers in self.original_handlers.values()
+                    for handler in logger_handlers
+                }.values())
+                
+                # Records below every handler's level would be discarded by the
+                # listener anyway; give the queue handler that level so the logger
+                # rejects them before they are prepared and queued
+                self._min_level = min(
+                    (handler.level for handler in unique_handlers),
+                    default=logging.NOTSET
+                )
+                self.queue_handler.setLevel(self._min_level)
                 
                 # Create and start the queue listener
                 self.listener = logging.handlers.QueueListener(
@@ -112,6 +231,7 @@ class AsyncLogManager:
                     respect_handler_level=True
                 )
                 self.listener.start()
+                self.queue_handler.listener = self.listener
                 
                 # Register cleanup function to stop the listener on exit
                 atexit.register(self.cleanup)
@@ -119,28 +239,44 @@ class AsyncLogManager:
                 self.is_setup = True
             except Exception as e:
                 # If setup fails, log the error and continue with standard logging
-                import sys
                 print(f"Error setting up async logging: {e}", file=sys.stderr)
-                import traceback
                 traceback.print_exc(file=sys.stderr)
                 
                 # Try to restore original handlers if possible
                 try:
-                    for logger_name, handlers in self.original_handlers.items():
-                        logger = logging.getLogger(logger_name)
-                        # Remove queue handler if it was added
-                        if self.queue_handler in logger.handlers:
-                            logger.removeHandler(self.queue_handler)
-                        # Restore original handlers
-                        for handler in handlers:
-                            if handler not in logger.handlers:
-                                logger.addHandler(handler)
+                    self._restore_original_handlers()
                 except Exception:
                     # Last resort - just make sure root logger has a handler
                     root = logging.getLogger()
                     if not root.handlers:
                         root.addHandler(logging.StreamHandler(sys.stderr))
     
+    def _restore_original_handlers(self) -> None:
+        """Swap the queue handler on each patched logger back for its original handlers."""
+        for logger_name, handlers in self.original_handlers.items():
+            logger = logging.getLogger(logger_name)
+            # Snapshot handler identities once instead of scanning the list per handler
+            present = set(map(id, logger.handlers))
+            
+            # Remove queue handler if it was added
+            if self.queue_handler and id(self.queue_handler) in present:
+                logger.removeHandler(self.queue_handler)
+            
+            # Restore original handlers
+            for handler in handlers:
+                if id(handler) not in present:
+                    logger.addHandler(handler)
+                    present.add(id(handler))
+    
+    @staticmethod
+    def _clear_queue(log_queue: queue.Queue) -> None:
+        """Discard everything in a queue in one step, with the listener already stopped."""
+        with log_queue.mutex:
+            log_queue.queue.clear()
+            log_queue.unfinished_tasks = 0
+            log_queue.all_tasks_done.notify_all()
+            log_queue.not_full.notify_all()
+    
     def patch_werkzeug_logger(self) -> None:
         """
         Patch the Werkzeug logger to use async logging.
@@ -155,8 +291,8 @@ class AsyncLogManager:
                 
             try:
                 # Create a separate queue handler for Werkzeug
-                werkzeug_queue = queue.Queue(maxsize=DEFAULT_QUEUE_SIZE)
-                self.werkzeug_queue_handler = logging.handlers.QueueHandler(werkzeug_queue)
+                self.werkzeug_queue = queue.Queue(maxsize=DEFAULT_QUEUE_SIZE)
+                self.werkzeug_queue_handler = _DropOnFullQueueHandler(self.werkzeug_queue)
                 
                 # Get the Werkzeug logger
                 werkzeug_logger = logging.getLogger('werkzeug')
@@ -166,7 +302,6 @@ class AsyncLogManager:
                 
                 # If no handlers, add a default one to ensure logs are captured
                 if not werkzeug_handlers:
-                    import sys
                     default_handler = logging.StreamHandler(sys.stdout)
                     default_handler.setFormatter(logging.Formatter(
                         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -180,8 +315,9 @@ class AsyncLogManager:
                 werkzeug_logger.addHandler(self.werkzeug_queue_handler)
                 
                 # Create and start a separate queue listener for Werkzeug
-                self.werkzeug_listener = logging.handlers.QueueListener(
-                    werkzeug_queue,
+                self.werkzeug_listener = _DropReportingQueueListener(
+                    self.werkzeug_queue,
+                    self.werkzeug_queue_handler,
                     *werkzeug_handlers,
                     respect_handler_level=True
                 )
@@ -191,9 +327,7 @@ class AsyncLogManager:
                 self.werkzeug_logger_patched = True
             except Exception as e:
                 # If patching fails, log the error and continue with standard logging
-                import sys
                 print(f"Error patching Werkzeug logger: {e}", file=sys.stderr)
-                import traceback
                 traceback.print_exc(file=sys.stderr)
                 
                 # Make sure Werkzeug logger has at least one handler
@@ -218,7 +352,6 @@ class AsyncLogManager:
                         # If there's no thread, just set to None without calling stop()
                         pass
                 except Exception as e:
-                    import sys
                     print(f"Error stopping log listener: {e}", file=sys.stderr)
                 finally:
                     self.listener = None
@@ -234,33 +367,21 @@ class AsyncLogManager:
                         # If there's no thread, just set to None without calling stop()
                         pass
                 except Exception as e:
-                    import sys
                     print(f"Error stopping Werkzeug log listener: {e}", file=sys.stderr)
                 finally:
                     self.werkzeug_listener = None
             
             # Restore original handlers if possible
             try:
-                for logger_name, handlers in self.original_handlers.items():
-                    logger = logging.getLogger(logger_name)
-                    
-                    # Remove queue handler if it was added
-                    if self.queue_handler and self.queue_handler in logger.handlers:
-                        logger.removeHandler(self.queue_handler)
-                    
-                    # Restore original handlers
-                    for handler in handlers:
-                        if handler not in logger.handlers:
-                            logger.addHandler(handler)
+                self._restore_original_handlers()
             except Exception as e:
-                import sys
                 print(f"Error restoring original log handlers: {e}", file=sys.stderr)
             
-            # Clear the queue to prevent memory leaks
+            # Clear the queues to prevent memory leaks
             try:
-                while not self.log_queue.empty():
-                    self.log_queue.get_nowait()
-                    self.log_queue.task_done()
+                self._clear_queue(self.log_queue)
+                if self.werkzeug_queue is not None:
+                    self._clear_queue(self.werkzeug_queue)
             except Exception:
                 # Ignore errors in queue cleanup
                 pass
@@ -289,7 +410,12 @@ class ThreadSafeConsoleStreamHandler(logging.Handler):
         """
         super().__init__()
         self.message_queue = message_queue
-        self._local_queue = queue.Queue()
+        # Records waiting for the worker; deque append/popleft are atomic, so the
+        # emit path needs no lock, only a wakeup signal for the worker
+        self._local_queue = collections.deque()
+        self._signal = threading.Event()
+        # (second, formatted timestamp) so strftime runs at most once per second
+        self._ts_cache = (0, "")
         self._worker = threading.Thread(
             target=self._queue_worker,
             name="ConsoleStreamHandlerWorker",
@@ -306,53 +432,88 @@ class ThreadSafeConsoleStreamHandler(logging.Handler):
         """
         try:
             # Put the record in the local queue for async processing
-            self._local_queue.put(record)
+            self._local_queue.append(record)
+            self._signal.set()
         except Exception:
             self.handleError(record)
     
-    def _queue_worker(self):
-        """Worker thread that processes log records from the local queue."""
-        import time
-        import sys
-        import traceback
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record creation time, reusing the previous result within the same second.
         
+        Args:
+            created: Record creation time in seconds since the epoch
+            
+        Returns:
+            Timestamp formatted as YYYY-MM-DD HH:MM:SS
+        """
+        second = int(created)
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, time.strftime(CONSOLE_TIMESTAMP_FORMAT, time.localtime(second)))
+        return self._ts_cache[1]
+    
+    def _process_record(self, record):
+        """
+        Format a single log record and forward it to the message queue.
+        
+        Args:
+            record: Log record to process
+        """
+        try:
+            # Format the record
+            msg = self.format(record)
+            
+            # Determine message type based on log level
+            level_info = _LEVEL_TABLE.get(record.levelno)
+            if level_info is None:
+                # Custom level: classify it by the nearest standard threshold
+                level_info = ("error", True) if record.levelno >= logging.ERROR else \
+                             ("warning", False) if record.levelno >= logging.WARNING else \
+                             ("info", False)
+            msg_type, is_error = level_info
+            
+            # Reuse the asctime the formatter just rendered when it is in the console format
+            formatter = self.formatter
+            if (formatter is not None and formatter.datefmt == CONSOLE_TIMESTAMP_FORMAT
+                    and formatter.usesTime()):
+                timestamp = record.asctime
+            else:
+                timestamp = self._format_timestamp(record.created)
+            
+            # Add to the message queue with type information
+            self.message_queue.put({
+                "message": msg,
+                "is_error": is_error,
+                "type": msg_type,
+                "timestamp": timestamp
+            })
+        except Exception as e:
+            # Handle error but don't crash the worker thread
+            try:
+                self.handleError(record)
+            except Exception:
+                # Last resort error handling
+                print(f"Critical error in console stream handler: {e}", file=sys.stderr)
+                traceback.print_exc(file=sys.stderr)
+    
+    def _queue_worker(self):
+        """Worker thread that processes log records from the local queue in batches."""
         while True:
             try:
-                # Get a record from the local queue
-                record = self._local_queue.get(timeout=QUEUE_TIMEOUT)
+                # Wait for emit() to signal, then drain everything already queued
+                # so a burst of records costs one wakeup instead of one per record.
+                # Clearing before draining means a record appended meanwhile
+                # re-sets the signal and is picked up on the next pass.
+                if not self._signal.wait(QUEUE_TIMEOUT):
+                    continue
+                self._signal.clear()
                 
-                try:
-                    # Format the record
-                    msg = self.format(record)
-                    
-                    # Determine message type based on log level
-                    msg_type = "error" if record.levelno >= logging.ERROR else \
-                              "warning" if record.levelno >= logging.WARNING else "info"
-                    
-                    # Add to the message queue with type information
-                    self.message_queue.put({
-                        "message": msg,
-                        "is_error": record.levelno >= logging.ERROR,
-                        "type": msg_type,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                except Exception as e:
-                    # Handle error but don't crash the worker thread
+                while self._local_queue:
                     try:
-                        self.handleError(record)
-                    except Exception:
-                        # Last resort error handling
-                        print(f"Critical error in console stream handler: {e}", file=sys.stderr)
-                        traceback.print_exc(file=sys.stderr)
-                finally:
-                    try:
-                        self._local_queue.task_done()
-                    except Exception:
-                        # Ignore errors in task_done
-                        pass
-            except queue.Empty:
-                # No records to process, continue waiting
-                continue
+                        record = self._local_queue.popleft()
+                    except IndexError:
+                        break
+                    self._process_record(record)
             except Exception as e:
                 # Log but don't crash the worker thread
                 print(f"Error in console stream handler worker: {e}", file=sys.stderr)
@@ -1,13 +1,35 @@
 """
 Configuration management for Cybex Pulse.
 """
+import atexit
+import contextlib
+import copy
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("cybex_pulse.config")
 
+# Use orjson for (de)serialization when it is installed, falling back to json
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    
+    _loads = json.loads
+
+# Marks a cache miss in Config.get, since None is a valid configuration value
+_MISSING = object()
+
+
 class Config:
     """Configuration manager for Cybex Pulse application."""
     
@@ -73,14 +95,40 @@ class Config:
             config_path: Path to the configuration file
         """
         self.config_path = Path(config_path)
+        # Flat (section, key) -> value view of the config for single-lookup get()
+        self._flat: Dict[Tuple[str, Any], Any] = {}
         self.config = self._load_config()
+        # Changes made through set() are buffered until flush()/save()
+        self._dirty = False
+        # Serialized bytes of the last successful write, to skip identical rewrites
+        self._last_saved: Optional[bytes] = None
+        # (section, key) -> callbacks to run when set() changes that value
+        self._subscribers: Dict[Tuple[str, str], List[Callable[[], None]]] = {}
+        atexit.register(self.flush)
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The configuration dictionary."""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._rebuild_flat()
+    
+    def _rebuild_flat(self) -> None:
+        """Rebuild the flat (section, key) lookup table from the configuration."""
+        self._flat = {
+            (section, key): value
+            for section, values in self._config.items() if isinstance(values, dict)
+            for key, value in values.items()
+        }
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default if not exists."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r") as f:
-                    config = json.load(f)
+                config = _loads(self.config_path.read_bytes())
                 logger.info(f"Configuration loaded from {self.config_path}")
                 
                 # Update with any missing default values
@@ -89,15 +137,14 @@ class Config:
             except Exception as e:
                 logger.error(f"Error loading configuration: {e}")
                 logger.info("Using default configuration")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(_FROZEN_DEFAULTS)
         else:
             logger.info(f"Configuration file not found, creating default at {self.config_path}")
-            config = self.DEFAULT_CONFIG.copy()
+            config = copy.deepcopy(_FROZEN_DEFAULTS)
             # Save the default config to file
             try:
                 self.config_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.config_path, "w") as f:
-                    json.dump(config, f, indent=4)
+                self.config_path.write_bytes(_dumps(config))
                 logger.info(f"Configuration saved to {self.config_path}")
             except Exception as e:
                 logger.error(f"Error saving configuration: {e}")
@@ -105,31 +152,62 @@ class Config:
     
     def _update_with_defaults(self, config: Dict[str, Any]) -> None:
         """Update configuration with any missing default values."""
-        def update_nested(target, source):
-            for key, value in source.items():
-                if key not in target:
-                    target[key] = value
-                elif isinstance(value, dict) and isinstance(target[key], dict):
-                    update_nested(target[key], value)
-        
-        update_nested(config, self.DEFAULT_CONFIG)
+        for path, value in _DEFAULT_PATHS:
+            target = config
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+                if not isinstance(target, dict):
+                    # User replaced a section with a non-dict value; leave it alone
+                    break
+            else:
+                if path[-1] not in target:
+                    target[path[-1]] = copy.deepcopy(value)
     
     def save(self) -> bool:
         """Save current configuration to file.
         
+        The file is replaced atomically, and the write is skipped entirely
+        if the serialized configuration matches what was last written.
+        
         Returns:
             bool: True if successful, False otherwise
         """
         try:
+            data = _dumps(self.config)
+            if data == self._last_saved:
+                self._dirty = False
+                return True
+            
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w") as f:
-                json.dump(self.config, f, indent=4)
+            tmp_path = self.config_path.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.config_path)
+            except OSError:
+                # Don't leave the partial file next to the configuration
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+            
+            self._last_saved = data
+            self._dirty = False
             logger.info(f"Configuration saved to {self.config_path}")
             return True
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
             return False
     
+    def flush(self) -> bool:
+        """Save pending changes made through set(), if there are any.
+        
+        Returns:
+            bool: True if nothing was pending or the save succeeded, False otherwise
+        """
+        if not self._dirty:
+            return True
+        return self.save()
+    
     def get(self, section: str, key: Optional[str] = None, default: Any = None) -> Any:
         """Get configuration value.
         
@@ -141,6 +219,13 @@ class Config:
         Returns:
             Configuration value, default value, or None if not found
         """
+        if key is not None:
+            value = self._flat.get((section, key), _MISSING)
+            if value is not _MISSING:
+                return value
+        
+        # Slow path: whole sections, missing keys, and sections that were
+        # added to self.config directly rather than through set()
         if section not in self.config:
             return default
         
@@ -155,6 +240,10 @@ class Config:
     def set(self, section: str, key: str, value: Any) -> bool:
         """Set configuration value.
         
+        The change is kept in memory; call flush() to write it to disk.
+        It is flushed at exit too, but not when the process ends with
+        os._exit(), as restart_application does, so flush before restarting.
+        
         Args:
             section: Configuration section
             key: Configuration key within section
@@ -167,12 +256,49 @@ class Config:
             self.config[section] = {}
         
         self.config[section][key] = value
-        return self.save()
+        self._flat[(section, key)] = value
+        self._dirty = True
+        for callback in self._subscribers.get((section, key), ()):
+            callback()
+        return True
+    
+    def subscribe(self, section: str, key: str, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever a value is changed through set().
+        
+        For settings that are read once and cached, so a change made at
+        runtime (from the settings page, say) still takes effect.
+        
+        Args:
+            section: Configuration section
+            key: Configuration key within section
+            callback: Function called with no arguments after the value is set
+        """
+        self._subscribers.setdefault((section, key), []).append(callback)
     
     def is_configured(self) -> bool:
         """Check if application has been configured."""
         return self.get("general", "configured") is True
     
     def mark_as_configured(self) -> bool:
-        """Mark application as configured."""
-        return self.set("general", "configured", True)
\ No newline at end of file
+        """Mark application as configured and write the configuration to disk."""
+        self.set("general", "configured", True)
+        return self.flush()
+
+
+def _flatten_defaults(defaults: Dict[str, Any],
+                      prefix: Tuple[str, ...] = ()) -> Tuple[Tuple[Tuple[str, ...], Any], ...]:
+    """Flatten a nested defaults dict into (key path, default value) pairs."""
+    paths = []
+    for key, value in defaults.items():
+        if isinstance(value, dict) and value:
+            paths.extend(_flatten_defaults(value, prefix + (key,)))
+        else:
+            paths.append((prefix + (key,), value))
+    return tuple(paths)
+
+
+# Private snapshot of the defaults, immune to later mutation of DEFAULT_CONFIG
+_FROZEN_DEFAULTS = copy.deepcopy(Config.DEFAULT_CONFIG)
+
+# Every leaf of the defaults as a flat list, so filling in missing keys is a straight loop
+_DEFAULT_PATHS = _flatten_defaults(_FROZEN_DEFAULTS)
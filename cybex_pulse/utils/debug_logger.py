@@ -4,15 +4,209 @@ Debug logging utility for Cybex Pulse.
 This module provides enhanced debug logging functionality that can be enabled/disabled
 through configuration settings.
 """
+import atexit
+import collections
+import contextlib
 import logging
-import inspect
+import queue
+import sys
 import threading
 import time
-from typing import Any, Dict, Optional
+import weakref
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from cybex_pulse.utils.config import Config
 
+# Critical issue messages are appended to their log file by a single background
+# thread so callers never block on file I/O
+CRITICAL_QUEUE_SIZE = 10000
+CRITICAL_BUFFER_SIZE = 64 * 1024  # Write buffer for each critical issues log file
+CRITICAL_FLUSH_EVERY = 100  # Flush after this many buffered messages...
+CRITICAL_FLUSH_INTERVAL = 1.0  # ...or after this many seconds, whichever comes first
+_critical_queue: "queue.Queue" = queue.Queue(maxsize=CRITICAL_QUEUE_SIZE)
+_critical_writer: Optional[threading.Thread] = None
+_critical_writer_lock = threading.Lock()
+_CRITICAL_STOP = object()
+
+# Number of caller frames recorded for each tracked resource
+MAX_TRACKED_FRAMES = 8
+
+# Per-thread cache of (name, ident) for the current thread
+_thread_info_local = threading.local()
+
+# Marks records logged through DebugLogger.debug for _DebugContextFilter
+_DEBUG_CONTEXT_EXTRA = {"debug_context": True}
+
+
+def _critical_writer_loop() -> None:
+    """Append queued (path, message) pairs to their critical issues log files.
+    
+    Each file is opened once with a large buffer; buffered messages are
+    flushed in batches rather than with one write syscall per message.
+    """
+    files = {}
+    pending = 0
+    last_flush = time.monotonic()
+    
+    def flush_all() -> None:
+        for path, f in files.items():
+            try:
+                f.flush()
+            except Exception as e:
+                print(f"Error flushing critical issues log {path}: {e}", file=sys.stderr)
+    
+    while True:
+        try:
+            item = _critical_queue.get(timeout=CRITICAL_FLUSH_INTERVAL)
+        except queue.Empty:
+            item = None
+        
+        if item is _CRITICAL_STOP:
+            flush_all()
+            return
+        
+        if item is not None:
+            path, message = item
+            try:
+                f = files.get(path)
+                if f is None:
+                    f = files[path] = open(path, "ab", buffering=CRITICAL_BUFFER_SIZE)
+                f.write(message.encode())
+                pending += 1
+            except Exception as e:
+                print(f"Error writing to critical issues log {path}: {e}", file=sys.stderr)
+        
+        now = time.monotonic()
+        if pending and (pending >= CRITICAL_FLUSH_EVERY or now - last_flush >= CRITICAL_FLUSH_INTERVAL):
+            flush_all()
+            pending = 0
+            last_flush = now
+
+
+def _stop_critical_writer() -> None:
+    """Flush buffered critical issue messages and stop the writer thread at exit."""
+    if _critical_writer is None:
+        return
+    try:
+        _critical_queue.put(_CRITICAL_STOP, timeout=1.0)
+        _critical_writer.join(timeout=2.0)
+    except queue.Full:
+        pass
+
+
+def _write_critical(path: Path, message: str) -> None:
+    """Hand a critical issue message to the background writer thread.
+    
+    Args:
+        path: Critical issues log file
+        message: Formatted message to append
+    """
+    global _critical_writer
+    if _critical_writer is None:
+        with _critical_writer_lock:
+            if _critical_writer is None:
+                _critical_writer = threading.Thread(
+                    target=_critical_writer_loop,
+                    name="CriticalIssueLogWriter",
+                    daemon=True
+                )
+                _critical_writer.start()
+                atexit.register(_stop_critical_writer)
+    
+    try:
+        _critical_queue.put_nowait((path, message))
+    except queue.Full:
+        # Writer has fallen behind; write directly rather than lose the message
+        with open(path, "a") as f:
+            f.write(message)
+
+
+# DebugLogger methods replaced by _noop on instances with debug logging disabled
+_NOOP_METHODS = (
+    "debug",
+    "start_timer",
+    "end_timer",
+    "track_resource",
+    "release_resource",
+    "log_resources",
+    "log_thread_info",
+)
+
+
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for DebugLogger methods while debug logging is disabled."""
+    return None
+
+
+def _thread_info() -> Tuple[str, Optional[int]]:
+    """Get the current thread's name and id, looked up once per thread.
+    
+    Returns:
+        Tuple of (thread name, thread id)
+    """
+    info = getattr(_thread_info_local, "info", None)
+    if info is None:
+        thread = threading.current_thread()
+        info = _thread_info_local.info = (thread.name, thread.ident)
+    return info
+
+
+class _TrackerEntry:
+    """A resource tracked by DebugLogger, with where, when and by which thread it was tracked."""
+    
+    __slots__ = ("resource", "weak", "stack", "thread", "time")
+    
+    def __init__(self, resource: Any, stack: Tuple[Tuple[str, str, int], ...], thread: str, started: float,
+                 on_collect: Optional[Callable[[weakref.ref], None]] = None):
+        """Initialize the entry.
+        
+        Args:
+            resource: Resource object being tracked
+            stack: Nearest callers as (filename, function, line) tuples
+            thread: Name of the thread that tracked the resource
+            started: time.monotonic() value when the resource was tracked
+            on_collect: Called with the weak reference once the resource is garbage collected
+        """
+        # Hold the resource weakly so tracking it doesn't keep it alive; objects
+        # that don't support weak references (str, int, ...) are held directly
+        try:
+            self.resource = weakref.ref(resource, on_collect)
+            self.weak = True
+        except TypeError:
+            self.resource = resource
+            self.weak = False
+        self.stack = stack
+        self.thread = thread
+        self.time = started
+    
+    def is_alive(self) -> bool:
+        """Check whether the tracked resource still exists.
+        
+        Returns:
+            bool: False once a weakly held resource has been garbage collected
+        """
+        return not self.weak or self.resource() is not None
+
+
+class _DebugContextFilter(logging.Filter):
+    """Prefix DebugLogger records with their thread and call site.
+    
+    The values are read from fields the logging module fills in on every
+    LogRecord, so no context is gathered for calls filtered out by level.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "debug_context", False):
+            record.msg = (f"[{record.threadName}:{record.thread}] "
+                          f"[{record.filename}:{record.funcName}:{record.lineno}] {record.msg}")
+        return True
+
+
+# Shared so wrapping the same logger twice doesn't add the prefix twice
+_debug_context_filter = _DebugContextFilter()
+
+
 class DebugLogger:
     """Debug logger utility for Cybex Pulse.
     
@@ -36,17 +230,44 @@ class DebugLogger:
         self.logger = logger
         self.config = config
         self._resource_trackers = {}
-        self._resource_trackers_lock = threading.RLock()
+        self._resource_trackers_lock = threading.Lock()
+        # (name, weak reference) of tracked resources that were garbage collected,
+        # dropped from _resource_trackers the next time the lock is taken. The
+        # weakref callback can run mid-GC in a thread already holding the lock,
+        # so it only appends here rather than taking it.
+        self._collected_resources = collections.deque()
         self._operation_timers = {}
-        self._operation_timers_lock = threading.RLock()
+        self._operation_timers_lock = threading.Lock()
+        self._debug_enabled = False
+        self.logger.addFilter(_debug_context_filter)
+        self.refresh()
+        # Pick up the setting being toggled from the settings page
+        self.config.subscribe("general", "debug_logging", self.refresh)
+        
+    def refresh(self) -> None:
+        """Re-read the debug logging setting from the configuration.
+        
+        The setting is cached so the disabled path costs a single attribute
+        read; this runs whenever the setting is changed through Config.set.
+        """
+        self._debug_enabled = bool(self.config.get("general", "debug_logging", False))
+        
+        # While disabled, shadow the logging methods with a no-op so calls skip
+        # even the enabled check; re-enabling falls back to the real methods
+        for name in _NOOP_METHODS:
+            if self._debug_enabled:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, _noop)
         
     def is_debug_enabled(self) -> bool:
-        """Check if debug logging is enabled in configuration.
+        """Check if debug logging is enabled.
         
         Returns:
-            bool: True if debug logging is enabled, False otherwise
+            bool: True if debug logging is enabled in the configuration and
+                  the underlying logger would emit debug records, False otherwise
         """
-        return self.config.get("general", "debug_logging", False)
+        return self._debug_enabled and self.logger.isEnabledFor(logging.DEBUG)
     
     def debug(self, message: str, *args, **kwargs) -> None:
         """Log a debug message if debug logging is enabled.
@@ -56,25 +277,15 @@ class DebugLogger:
             *args: Additional positional arguments for the logger
             **kwargs: Additional keyword arguments for the logger
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
             
-        # Get caller information
-        frame = inspect.currentframe().f_back
-        func_name = frame.f_code.co_name
-        filename = frame.f_code.co_filename.split('/')[-1]
-        lineno = frame.f_lineno
-        
-        # Get thread information
-        thread = threading.current_thread()
-        thread_name = thread.name
-        thread_id = thread.ident
-        
-        # Format debug message with context
-        context_message = f"[{thread_name}:{thread_id}] [{filename}:{func_name}:{lineno}] {message}"
-        
-        # Log the message
-        self.logger.debug(context_message, *args, **kwargs)
+        # The thread and caller of this method are added to the message by
+        # _DebugContextFilter from the record's own fields
+        extra = kwargs.pop("extra", None)
+        kwargs["extra"] = {**extra, **_DEBUG_CONTEXT_EXTRA} if extra else _DEBUG_CONTEXT_EXTRA
+        kwargs.setdefault("stacklevel", 2)
+        self.logger.debug(message, *args, **kwargs)
     
     def start_timer(self, operation_name: str) -> None:
         """Start a timer for an operation.
@@ -82,11 +293,11 @@ class DebugLogger:
         Args:
             operation_name: Name of the operation to time
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
         
         with self._operation_timers_lock:
-            self._operation_timers[operation_name] = time.time()
+            self._operation_timers[operation_name] = time.monotonic()
             
         self.debug(f"Starting operation: {operation_name}")
     
@@ -99,23 +310,19 @@ class DebugLogger:
         Returns:
             float: Elapsed time in seconds, or None if timer wasn't started
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return None
         
-        start_time = None
         with self._operation_timers_lock:
-            if operation_name not in self._operation_timers:
-                self.debug(f"No timer found for operation: {operation_name}")
-                return None
-                
-            start_time = self._operation_timers.pop(operation_name)
+            start_time = self._operation_timers.pop(operation_name, None)
             
-        if start_time is not None:
-            elapsed_time = time.time() - start_time
-            self.debug(f"Operation completed: {operation_name} - Took {elapsed_time:.4f} seconds")
-            return elapsed_time
-        
-        return None
+        if start_time is None:
+            self.debug(f"No timer found for operation: {operation_name}")
+            return None
+            
+        elapsed_time = time.monotonic() - start_time
+        self.debug(f"Operation completed: {operation_name} - Took {elapsed_time:.4f} seconds")
+        return elapsed_time
     
     def track_resource(self, resource_name: str, resource: Any) -> None:
         """Track a resource for potential leaks.
@@ -124,16 +331,23 @@ class DebugLogger:
             resource_name: Name of the resource
             resource: Resource object to track
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
         
+        # Record the nearest callers as (filename, function, line) tuples; unlike
+        # inspect.stack() this never reads source files or keeps frames alive
+        stack = []
+        frame = sys._getframe(1)
+        while frame is not None and len(stack) < MAX_TRACKED_FRAMES:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_name, frame.f_lineno))
+            frame = frame.f_back
+        
+        entry = _TrackerEntry(resource, tuple(stack), _thread_info()[0], time.monotonic(),
+                              lambda ref: self._collected_resources.append((resource_name, ref)))
         with self._resource_trackers_lock:
-            self._resource_trackers[resource_name] = {
-                'resource': resource,
-                'stack': inspect.stack()[1:],
-                'thread': threading.current_thread().name,
-                'time': time.time()
-            }
+            self._forget_collected()
+            self._resource_trackers[resource_name] = entry
             
         self.debug(f"Resource tracked: {resource_name}")
     
@@ -143,7 +357,7 @@ class DebugLogger:
         Args:
             resource_name: Name of the resource to release
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
         
         released = False
@@ -157,33 +371,55 @@ class DebugLogger:
         else:
             self.debug(f"Attempted to release untracked resource: {resource_name}")
     
+    def _forget_collected(self) -> None:
+        """Drop the entries of garbage collected resources; call with _resource_trackers_lock held."""
+        while self._collected_resources:
+            name, ref = self._collected_resources.popleft()
+            entry = self._resource_trackers.get(name)
+            # The name may have been tracked again for a new resource since
+            if entry is not None and entry.resource is ref:
+                del self._resource_trackers[name]
+    
+    def tracked_resources(self) -> List[Tuple[str, _TrackerEntry]]:
+        """Get the resources that are tracked and still exist.
+        
+        Returns:
+            list: (name, entry) pairs, snapshotted so the caller can use them without the lock
+        """
+        with self._resource_trackers_lock:
+            self._forget_collected()
+            return [
+                (name, entry) for name, entry in self._resource_trackers.items()
+                if entry.is_alive()
+            ]
+    
     def log_resources(self) -> None:
         """Log all currently tracked resources."""
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
         
-        # Make a copy of the resources to avoid holding the lock during logging
-        with self._resource_trackers_lock:
-            if not self._resource_trackers:
-                return
-                
-            resources_copy = dict(self._resource_trackers)
+        resources = self.tracked_resources()
+        if not resources:
+            return
             
-        self.debug(f"Currently tracking {len(resources_copy)} resources:")
-        for name, info in resources_copy.items():
-            elapsed = time.time() - info['time']
-            self.debug(f"  - {name} (tracked for {elapsed:.1f} seconds, thread: {info['thread']})")
+        # Emit one multi-line record rather than one record per resource
+        now = time.monotonic()
+        lines = [f"Currently tracking {len(resources)} resources:"]
+        for name, entry in resources:
+            elapsed = now - entry.time
+            lines.append(f"  - {name} (tracked for {elapsed:.1f} seconds, thread: {entry.thread})")
+        self.debug("\n".join(lines))
     
     def log_thread_info(self) -> None:
         """Log information about all active threads."""
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
             
         threads = threading.enumerate()
-        self.debug(f"Active threads ({len(threads)}):")
-        
+        lines = [f"Active threads ({len(threads)}):"]
         for thread in threads:
-            self.debug(f"  - {thread.name} (id: {thread.ident}, daemon: {thread.daemon}, alive: {thread.is_alive()})")
+            lines.append(f"  - {thread.name} (id: {thread.ident}, daemon: {thread.daemon}, alive: {thread.is_alive()})")
+        self.debug("\n".join(lines))
     
     def log_critical_issue(self, issue_type: str, message: str, details: Dict[str, Any] = None) -> None:
         """Log a critical issue to both debug log and a special critical issues log file.
@@ -193,7 +429,7 @@ class DebugLogger:
             message: Description of the issue
             details: Additional details about the issue
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
             return
             
         # Log to debug log
@@ -226,37 +462,39 @@ class DebugLogger:
                     formatted_message += f"\nDetails: {details}"
                 formatted_message += "\n\n"
                 
-                # Use a file lock to prevent concurrent writes
-                # This is a simple approach - for high-volume logging, consider using a queue
-                critical_log_lock = threading.Lock()
-                with critical_log_lock:
-                    # Append to the critical issues log
-                    with open(critical_log_file, "a") as f:
-                        f.write(formatted_message)
-                    
+                # Append to the critical issues log from the background writer
+                _write_critical(critical_log_file, formatted_message)
+                
                 # Also log at ERROR level to ensure visibility in main log
                 self.logger.error(f"CRITICAL ISSUE - {issue_type}: {message}")
         except Exception as e:
             # Don't let errors in critical logging prevent normal operation
             self.debug(f"Error writing to critical issues log: {e}")
     
-    def log_lock_info(self, lock: threading.Lock, lock_name: str, acquiring: bool = True) -> None:
-        """Log information about lock acquisition and release.
+    @contextlib.contextmanager
+    def debug_lock(self, lock: threading.Lock, lock_name: str) -> Iterator[None]:
+        """Hold a lock for the duration of a with block, logging how long it was waited for and held.
+        
+        When debug logging is disabled this is a plain ``with lock:``. When
+        enabled, a single record is logged after the lock is released, so the
+        instrumentation adds no logging work inside the critical section.
         
         Args:
-            lock: The lock object
+            lock: The lock to acquire
             lock_name: Name of the lock for identification
-            acquiring: True if acquiring the lock, False if releasing
         """
-        if not self.is_debug_enabled():
+        if not self._debug_enabled or not self.logger.isEnabledFor(logging.DEBUG):
+            with lock:
+                yield
             return
-            
-        # Capture thread information outside of any locks to avoid potential deadlocks
-        action = "Acquiring" if acquiring else "Releasing"
-        thread = threading.current_thread()
-        thread_name = thread.name
-        thread_id = thread.ident
         
-        # Use a formatted message that doesn't require additional context gathering
-        # This reduces the chance of lock contention during logging
-        self.debug(f"{action} lock: {lock_name} (thread: {thread_name}, id: {thread_id})")
\ No newline at end of file
+        requested = time.monotonic()
+        lock.acquire()
+        acquired = time.monotonic()
+        try:
+            yield
+        finally:
+            lock.release()
+            released = time.monotonic()
+            self.debug(f"Lock {lock_name}: waited {acquired - requested:.4f} seconds, "
+                       f"held {released - acquired:.4f} seconds")
\ No newline at end of file
@@ -1,6 +1,10 @@
 """
 Utility functions for MAC address handling.
 """
+import re
+
+# "locally administered" markers and any parenthesised text, removed from vendor names
+_VENDOR_CLEAN_RE = re.compile(r'\(locally administered\)|locally administered|\([^)]*\)')
 
 def normalize_mac(mac_address: str) -> str:
     """Normalize MAC address to a consistent format.
@@ -33,12 +37,8 @@ def normalize_vendor(vendor: str) -> str:
     if not vendor:
         return ""
     
-    # Remove "locally administered" text
-    vendor = vendor.replace("(locally administered)", "").replace("locally administered", "")
-    
-    # Remove any parentheses and their contents
-    import re
-    vendor = re.sub(r'\([^)]*\)', '', vendor)
+    # Remove "locally administered" text and any parentheses and their contents
+    vendor = _VENDOR_CLEAN_RE.sub('', vendor)
     
     # Remove extra whitespace
     vendor = ' '.join(vendor.split())
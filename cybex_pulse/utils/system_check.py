@@ -1,66 +1,64 @@
 """
 System check utilities for Cybex Pulse.
 """
+import functools
 import logging
 import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 logger = logging.getLogger("cybex_pulse.system_check")
 
-def check_required_tools() -> Dict[str, bool]:
+# Command-line tools used by the scanners and monitors
+REQUIRED_TOOLS = (
+    "arp-scan",
+    "nmap",
+    "snmpwalk",
+    "arp",
+    "ip",
+    "getent",
+    "avahi-resolve",
+    "avahi-browse",
+    "speedtest-cli"
+)
+
+@functools.lru_cache(maxsize=1)
+def _find_required_tools() -> Tuple[Tuple[str, bool], ...]:
     """
-    Check if required tools are installed on the system.
+    Look up each required tool on the PATH once per process.
     
     Returns:
-        Dict[str, bool]: Dictionary with tool names as keys and boolean values
-                         indicating if they are installed.
+        Tuple[Tuple[str, bool], ...]: (tool name, installed) pairs
     """
-    required_tools = {
-        "arp-scan": False,
-        "nmap": False,
-        "snmpwalk": False,
-        "arp": False,
-        "ip": False,
-        "getent": False,
-        "avahi-resolve": False,
-        "avahi-browse": False,
-        "speedtest-cli": False
-    }
+    # Search for the tools in parallel; each lookup is a series of stat calls
+    # that release the GIL. shutil.which already checks that the file is
+    # executable, so a miss means the tool can't be run
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_TOOLS)) as executor:
+        paths = list(executor.map(shutil.which, REQUIRED_TOOLS))
     
-    # Check each tool
-    for tool in required_tools:
-        # First check if tool is in PATH
-        if shutil.which(tool) is not None:
-            required_tools[tool] = True
-        else:
-            # Try running the tool to check if it's available
-            try:
-                subprocess.run(
-                    [tool, "--version"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    check=False
-                )
-                required_tools[tool] = True
-            except FileNotFoundError:
-                logger.warning(f"Required tool not found: {tool}")
-                required_tools[tool] = False
-    
-    return required_tools
+    results = []
+    for tool, path in zip(REQUIRED_TOOLS, paths):
+        installed = path is not None
+        if not installed:
+            logger.warning(f"Required tool not found: {tool}")
+        results.append((tool, installed))
+    return tuple(results)
 
-def get_installation_instructions(tool: str) -> str:
+def check_required_tools() -> Dict[str, bool]:
     """
-    Get installation instructions for a specific tool.
+    Check if required tools are installed on the system.
+    
+    The PATH is only searched on the first call; later calls reuse the result.
     
-    Args:
-        tool: Name of the tool
-        
     Returns:
-        str: Installation instructions
+        Dict[str, bool]: Dictionary with tool names as keys and boolean values
+                         indicating if they are installed.
     """
-    instructions = {
-        "arp-scan": """
+    return dict(_find_required_tools())
+
+# Installation instructions for each required tool
+_INSTRUCTIONS = {
+    "arp-scan": """
 To install arp-scan:
 
 Ubuntu/Debian:
@@ -89,7 +87,7 @@ macOS:
 brew install arp-scan
 ```
 """,
-        "nmap": """
+    "nmap": """
 To install nmap:
 
 Ubuntu/Debian:
@@ -118,7 +116,7 @@ macOS:
 brew install nmap
 ```
 """,
-        "snmpwalk": """
+    "snmpwalk": """
 To install snmpwalk (part of net-snmp):
 
 Ubuntu/Debian:
@@ -147,7 +145,7 @@ macOS:
 brew install net-snmp
 ```
 """,
-        "arp": """
+    "arp": """
 To install arp (net-tools):
 
 Ubuntu/Debian:
@@ -176,7 +174,7 @@ macOS:
 Already installed by default
 ```
 """,
-        "ip": """
+    "ip": """
 To install ip command (iproute2):
 
 Ubuntu/Debian:
@@ -205,7 +203,7 @@ macOS:
 brew install iproute2mac
 ```
 """,
-        "getent": """
+    "getent": """
 To install getent:
 
 Ubuntu/Debian:
@@ -228,7 +226,7 @@ macOS:
 Not directly available on macOS
 ```
 """,
-        "avahi-resolve": """
+    "avahi-resolve": """
 To install avahi-resolve (part of avahi-utils):
 
 Ubuntu/Debian:
@@ -257,7 +255,7 @@ macOS:
 brew install avahi
 ```
 """,
-        "avahi-browse": """
+    "avahi-browse": """
 To install avahi-browse (part of avahi-utils):
 
 Ubuntu/Debian:
@@ -286,7 +284,7 @@ macOS:
 brew install avahi
 ```
 """,
-        "speedtest-cli": """
+    "speedtest-cli": """
 To install speedtest-cli:
 
 Ubuntu/Debian:
@@ -320,6 +318,16 @@ Using pip (all systems):
 pip install speedtest-cli
 ```
 """
-    }
+}
+
+def get_installation_instructions(tool: str) -> str:
+    """
+    Get installation instructions for a specific tool.
     
-    return instructions.get(tool, f"No installation instructions available for {tool}.")
\ No newline at end of file
+    Args:
+        tool: Name of the tool
+        
+    Returns:
+        str: Installation instructions
+    """
+    return _INSTRUCTIONS.get(tool, f"No installation instructions available for {tool}.")
\ No newline at end of file
@@ -1,218 +1,579 @@
 """
 System information utilities for Cybex Pulse.
 """
+import json
+import logging
 import os
 import psutil
 import platform
+import socket
+import struct
+import subprocess
+import sys
+import threading
 import time
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Any, List, Optional, Tuple, TypeVar
 
-# Cache for CPU model information to avoid repeated lookups
-_cpu_model_cache = None
-_cpu_count_cache = None
-_physical_cores_cache = None
+T = TypeVar("T")
+
+logger = logging.getLogger("cybex_pulse.system_info")
+
+# Linux metrics are parsed straight from /proc rather than through psutil
+_IS_LINUX = sys.platform.startswith('linux')
+
+# Errors that mean a metric couldn't be read from the system; anything else is a bug
+_READ_ERRORS = (OSError, ValueError, NotImplementedError, psutil.Error)
+
+# Adaptive TTLs scale between these multiples of the base TTL
+_MIN_TTL_SCALE = 0.5
+_MAX_TTL_SCALE = 4.0
+# Weight of the newest change in the moving average of changes
+_CHANGE_EWMA_ALPHA = 0.3
+
+def ttl_cache(ttl: float, value: Optional[Callable[[T], Optional[float]]] = None) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Create a decorator that caches a no-argument function's result for a time.
+    
+    Expiry is measured on the monotonic clock, so wall-clock changes can't
+    keep stale data around or force early refreshes. Exceptions are not
+    cached. When the result expires, one thread refreshes it while any
+    others calling at the same time wait for that result instead of
+    repeating the work.
+    
+    If value is given, the TTL adapts to how much the result changes: it
+    keeps a moving average of the change in value(result) between
+    refreshes, and scales the TTL from _MAX_TTL_SCALE times the base TTL
+    for a steady value down to _MIN_TTL_SCALE times for one that moves by
+    several units per refresh.
+    
+    Args:
+        ttl: Number of seconds to reuse a result for
+        value: Optional function picking the number to watch out of a
+               result, such as a usage percentage, or None if the result
+               doesn't have one
+        
+    Returns:
+        function: Decorator function
+    """
+    def decorator(f):
+        cached = None  # (expiry time, result)
+        lock = threading.Lock()
+        last_value = None
+        # Start at the change that gives the base TTL, until there's history
+        change_ewma = _MAX_TTL_SCALE - 1
+        
+        def next_ttl(result):
+            nonlocal last_value, change_ewma
+            current = value(result)
+            if current is None:
+                return ttl
+            if last_value is not None:
+                change = abs(current - last_value)
+                change_ewma += _CHANGE_EWMA_ALPHA * (change - change_ewma)
+            last_value = current
+            scale = _MAX_TTL_SCALE / (1 + change_ewma)
+            return ttl * min(max(scale, _MIN_TTL_SCALE), _MAX_TTL_SCALE)
+        
+        @wraps(f)
+        def decorated_function():
+            nonlocal cached
+            entry = cached
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            with lock:
+                # Another thread may have refreshed it while we waited
+                entry = cached
+                now = time.monotonic()
+                if entry is not None and now < entry[0]:
+                    return entry[1]
+                result = f()
+                cached = (time.monotonic() + (next_ttl(result) if value else ttl), result)
+                return result
+        return decorated_function
+    return decorator
+
+@lru_cache(maxsize=None)
+def get_platform_info() -> Dict[str, str]:
+    """
+    Get platform information, looked up once per process.
+    
+    Returns:
+        Dict[str, str]: Operating system name, release and version, machine type and processor
+    """
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor()
+    }
+
+# CPU counts don't change while we're running. sysconf answers the logical
+# count from libc; psutil is only needed where it isn't available
+try:
+    _CPU_COUNT = max(os.sysconf('SC_NPROCESSORS_ONLN'), 1)
+except (AttributeError, ValueError, OSError):
+    _CPU_COUNT = psutil.cpu_count(logical=True) or 1
+_PHYSICAL_CORES = psutil.cpu_count(logical=False) or 1
+
+# Not available on Windows
+_getloadavg = getattr(os, 'getloadavg', None)
 
 # Cache for CPU usage to avoid spikes in measurements
-_last_cpu_percent = 0
-_last_cpu_check_time = 0
 _CPU_CACHE_TTL = 0.5  # Cache CPU usage for 0.5 seconds
 
-def get_cpu_info() -> Dict[str, Any]:
+_CPU_FREQ_CHECK_INTERVAL = 5  # Check CPU frequency every 5 seconds
+
+# psutil.cpu_freq() reads scaling_cur_freq for every CPU in sysfs, which some
+# kernels recompute on each read; if the first call takes longer than this,
+# Linux falls back to the "cpu MHz" line of /proc/cpuinfo
+_SLOW_CPU_FREQ_SECONDS = 0.05
+
+_LOAD_AVG_CACHE_TTL = 10  # Cache load averages for 10 seconds (they move on a minute scale)
+
+# Cache for memory information
+_MEMORY_CACHE_TTL = 2  # Cache memory info for 2 seconds
+
+# Cache for disk information
+_DISK_CACHE_TTL = 5  # Cache disk info for 5 seconds (disk usage changes slowly)
+
+_DISK_IO_CHECK_INTERVAL = 10  # Check disk I/O counters every 10 seconds
+
+# Cache for network interfaces to avoid repeated lookups
+_INTERFACES_CACHE_TTL = 60  # Cache network interfaces for 60 seconds
+
+# Cache for network I/O statistics
+_NETWORK_IO_CACHE_TTL = 1  # Cache network I/O for 1 second
+
+# Complete system info is collected in the background this often
+_SNAPSHOT_INTERVAL = 1
+# Background collection stops after this many seconds without a reader
+_SNAPSHOT_IDLE_TIMEOUT = 60
+
+# Fallback readings; shared rather than copied, since readers never modify them
+_EMPTY_NETWORK_IO = {
+    "bytes_sent": 0,
+    "bytes_recv": 0,
+    "packets_sent": 0,
+    "packets_recv": 0
+}
+_EMPTY_DISK_IO = {
+    "read_count": None,
+    "write_count": None,
+    "read_bytes": None,
+    "write_bytes": None
+}
+
+# ioctl request for an interface's IPv4 address (from <linux/sockios.h>)
+_SIOCGIFADDR = 0x8915
+
+def _proc_cpuinfo_freq() -> Optional[float]:
     """
-    Get CPU information.
+    Get the first CPU's current frequency from /proc/cpuinfo.
     
     Returns:
-        Dict[str, Any]: Dictionary with CPU information
+        Optional[float]: Frequency in MHz, or None if /proc/cpuinfo doesn't report it
+    """
+    # The first processor's "cpu MHz" line is near the top
+    with open('/proc/cpuinfo', 'r') as f:
+        data = f.read(4096)
+    start = data.find('cpu MHz')
+    if start < 0:
+        return None
+    end = data.find('\n', start)
+    line = data[start:end] if end >= 0 else data[start:]
+    return float(line.partition(':')[2])
+
+def _read_cpu_model() -> str:
     """
-    global _cpu_model_cache, _cpu_count_cache, _physical_cores_cache
-    global _last_cpu_percent, _last_cpu_check_time
+    Look up the CPU model name.
     
+    Returns:
+        str: CPU model name, or a placeholder describing why it is unknown
+    """
+    model = None
     try:
-        current_time = time.time()
-        
-        # Use cached CPU percentage if recent enough
-        if current_time - _last_cpu_check_time <= _CPU_CACHE_TTL:
-            cpu_percent = _last_cpu_percent
+        system = get_platform_info()["system"]
+        if system == "Linux":
+            # The first processor's "model name" line is near the top,
+            # so one read of the head of the file is enough
+            with open('/proc/cpuinfo', 'r') as f:
+                data = f.read(4096)
+            start = data.find('model name')
+            if start >= 0:
+                end = data.find('\n', start)
+                line = data[start:end] if end >= 0 else data[start:]
+                model = line.partition(':')[2].strip()
+        elif system == "Darwin":  # macOS
+            model = subprocess.check_output(['sysctl', '-n', 'machdep.cpu.brand_string']).decode().strip()
         else:
-            # Get CPU usage percentage without blocking (interval=0)
-            # This returns the usage since the last call, or 0 on first call
-            cpu_percent = psutil.cpu_percent(interval=0)
-            _last_cpu_percent = cpu_percent
-            _last_cpu_check_time = current_time
+            model = get_platform_info()["processor"]
         
-        # Cache CPU count and cores to avoid repeated calls
-        if _cpu_count_cache is None:
-            _cpu_count_cache = psutil.cpu_count(logical=True) or 1
-        cpu_count = _cpu_count_cache
+        # If we couldn't determine the model, use a default
+        if not model:
+            model = get_platform_info()["processor"] or "Unknown CPU"
+    except (*_READ_ERRORS, subprocess.SubprocessError) as e:
+        model = f"Unknown (Error: {str(e)})"
+    return model
+
+def _read_meminfo() -> Dict[str, int]:
+    """
+    Read all of /proc/meminfo in a single read.
+    
+    Returns:
+        Dict[str, int]: Field names (without the trailing colon) mapped to
+                        their values, converted to bytes where given in kB
+    """
+    with open('/proc/meminfo', 'rb') as f:
+        data = f.read()
+    
+    meminfo = {}
+    for line in data.splitlines():
+        fields = line.split()
+        if len(fields) >= 2:
+            value = int(fields[1])
+            meminfo[fields[0].rstrip(b':').decode()] = value * 1024 if len(fields) > 2 else value
+    return meminfo
+
+def _linux_virtual_memory(meminfo: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Get memory usage from parsed /proc/meminfo, computed as psutil.virtual_memory() does.
+    
+    Args:
+        meminfo: Output of _read_meminfo()
         
-        if _physical_cores_cache is None:
-            _physical_cores_cache = psutil.cpu_count(logical=False) or 1
-        physical_cores = _physical_cores_cache
+    Returns:
+        Dict[str, Any]: Total, available and used bytes and percent used
+        
+    Raises:
+        KeyError: If the kernel doesn't report MemAvailable
+    """
+    total = meminfo["MemTotal"]
+    available = meminfo["MemAvailable"]
+    if available > total:
+        available = meminfo["MemFree"]
+    used = total - available
+    return {
+        "total": total,
+        "available": available,
+        "used": used,
+        "percent": round(used / total * 100, 1) if total else 0.0
+    }
+
+def _linux_network_interfaces() -> List[Dict[str, Any]]:
+    """
+    Get the network interfaces that have an IPv4 address, asking the kernel for each one directly.
+    
+    Interfaces without an IPv4 address are skipped as soon as the ioctl
+    fails, without building their address lists as getifaddrs() does.
+    
+    Returns:
+        List[Dict[str, Any]]: Name, MAC address and IPv4 address of each interface
+    """
+    import fcntl
+    
+    interfaces = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _, interface in socket.if_nameindex():
+            try:
+                ifreq = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, struct.pack('256s', interface[:15].encode()))
+            except OSError:
+                # No IPv4 address assigned
+                continue
+            ipv4 = socket.inet_ntoa(ifreq[20:24])
+            
+            try:
+                with open(f'/sys/class/net/{interface}/address', 'r') as f:
+                    mac = f.read().strip() or None
+            except OSError:
+                mac = None
+            
+            interfaces.append({
+                "name": interface,
+                "mac": mac,
+                "ipv4": ipv4
+            })
+    return interfaces
+
+def _identity(reading: float) -> float:
+    """Use a reading that is itself a percentage as the value to watch."""
+    return reading
+
+def _percent_of(info: Dict[str, Any]) -> Optional[float]:
+    """Watch the usage percentage of an info dict, if it has one."""
+    return info.get("percent")
+
+class SystemInfoCollector:
+    """
+    Collects system metrics, caching each reading for its own TTL.
+    
+    The module-level get_*() functions share one instance. Each instance
+    has its own caches, and the psutil functions it calls are bound as
+    attributes in __init__ so they can be replaced on an instance.
+    """
+    
+    def __init__(self):
+        """Initialize the collector with empty caches."""
+        # psutil functions used for readings
+        self._psutil_cpu_percent = psutil.cpu_percent
+        self._psutil_cpu_freq = psutil.cpu_freq
+        self._psutil_virtual_memory = psutil.virtual_memory
+        self._psutil_swap_memory = psutil.swap_memory
+        self._psutil_disk_usage = psutil.disk_usage
+        self._psutil_disk_io_counters = psutil.disk_io_counters
+        self._psutil_net_io_counters = psutil.net_io_counters
+        self._psutil_net_if_addrs = psutil.net_if_addrs
+        self._psutil_boot_time = psutil.boot_time
+        
+        # Previous (busy, total) CPU time from /proc/stat, in clock ticks
+        self._last_cpu_times = None
+        # CPU model name, looked up on first use
+        self._cpu_model = None
+        # Whether to read the CPU frequency from /proc/cpuinfo, decided by
+        # timing the first psutil.cpu_freq() call
+        self._use_proc_cpuinfo_freq = None
+        # Last formatted uptime, as (whole seconds of uptime, formatted string)
+        self._uptime_formatted = (-1, "")
+        # JSON rendering of the all_info() result it was made from
+        self._all_info_json = (None, None)
+        
+        # Latest all_info() snapshot, replaced whole by the refresher thread
+        self._snapshot = None
+        self._last_snapshot_read = 0.0
+        self._refresher = None
+        self._refresher_lock = threading.Lock()
+        
+        # Cached readings, each with its own expiry and lock. Usage
+        # percentages refresh less often while they hold steady
+        self._cpu_percent = ttl_cache(_CPU_CACHE_TTL, _identity)(self._read_cpu_percent)
+        self._cpu_freq = ttl_cache(_CPU_FREQ_CHECK_INTERVAL)(self._read_cpu_freq)
+        self._load_avg = ttl_cache(_LOAD_AVG_CACHE_TTL)(self._read_load_avg)
+        self._memory_info = ttl_cache(_MEMORY_CACHE_TTL, _percent_of)(self._read_memory_info)
+        self._disk_io = ttl_cache(_DISK_IO_CHECK_INTERVAL)(self._read_disk_io)
+        self._disk_info = ttl_cache(_DISK_CACHE_TTL, _percent_of)(self._read_disk_info)
+        self._network_io = ttl_cache(_NETWORK_IO_CACHE_TTL)(self._read_network_io)
+        self._network_interfaces = ttl_cache(_INTERFACES_CACHE_TTL)(self._read_network_interfaces)
+    
+    def _linux_cpu_percent(self) -> float:
+        """
+        Get CPU usage since the previous call from the aggregate line of /proc/stat.
+        
+        Busy time is counted the way psutil.cpu_percent() counts it: everything
+        except idle and iowait, with guest time already included in user time.
+        
+        Returns:
+            float: Usage percentage since the previous call, or 0 on the first call
+        """
+        with open('/proc/stat', 'rb') as f:
+            fields = f.readline().split()
+        
+        # user, nice, system, idle, iowait, irq, softirq, steal
+        times = [int(value) for value in fields[1:9]]
+        total = sum(times)
+        busy = total - times[3] - times[4]
+        
+        previous_busy, previous_total = self._last_cpu_times or (busy, total)
+        self._last_cpu_times = (busy, total)
+        
+        total_delta = total - previous_total
+        if total_delta <= 0:
+            return 0.0
+        busy_delta = max(0, busy - previous_busy)
+        return round(min(100.0, busy_delta / total_delta * 100), 1)
+    
+    def _read_cpu_percent(self) -> float:
+        """
+        Get CPU usage percentage without blocking (interval=0).
+        
+        Returns:
+            float: Usage since the previous sample, or 0 on the first call
+        """
+        if _IS_LINUX:
+            return self._linux_cpu_percent()
+        return self._psutil_cpu_percent(interval=0)
+    
+    def _read_cpu_freq(self) -> Optional[float]:
+        """
+        Get the current CPU frequency.
+        
+        Returns:
+            Optional[float]: Current frequency in MHz, or None if unavailable
+        """
+        try:
+            if self._use_proc_cpuinfo_freq:
+                return _proc_cpuinfo_freq()
+            start = time.monotonic()
+            cpu_freq = self._psutil_cpu_freq()
+            if self._use_proc_cpuinfo_freq is None:
+                self._use_proc_cpuinfo_freq = _IS_LINUX and time.monotonic() - start > _SLOW_CPU_FREQ_SECONDS
+            return cpu_freq.current if cpu_freq else None
+        except _READ_ERRORS:
+            # Ignore errors with CPU frequency
+            return None
+    
+    def _read_load_avg(self) -> Tuple[Optional[Tuple[float, ...]], Optional[Tuple[float, ...]]]:
+        """
+        Get the 1, 5 and 15 minute load averages, raw and normalized by CPU count.
+        
+        Returns:
+            Tuple: (load averages, load averages as a percentage of the logical
+                   CPU count), each None where unavailable
+        """
+        if _getloadavg is None:
+            return None, None
+        try:
+            load_avg = _getloadavg()
+            # Normalize load average by number of cores
+            return load_avg, tuple(round(load / _CPU_COUNT * 100, 2) for load in load_avg)
+        except _READ_ERRORS:
+            # Ignore errors with load average
+            return None, None
+    
+    def cpu_info(self) -> Dict[str, Any]:
+        """
+        Get CPU information.
+        
+        Returns:
+            Dict[str, Any]: Dictionary with CPU information
+        """
+        try:
+            cpu_percent = self._cpu_percent()
+        except _READ_ERRORS as e:
+            return {
+                "error": str(e)
+            }
         
         # Calculate normalized CPU percentage based on number of cores
-        normalized_percent = min(100, cpu_percent / cpu_count * 100) if cpu_count > 0 and cpu_percent > 0 else cpu_percent
+        normalized_percent = min(100, cpu_percent / _CPU_COUNT * 100) if cpu_percent > 0 else cpu_percent
         
-        # Get CPU frequency - only if needed and not too frequently
-        current_freq = None
-        if current_time % 5 < 1:  # Only check every ~5 seconds
-            try:
-                cpu_freq = psutil.cpu_freq()
-                current_freq = cpu_freq.current if cpu_freq else None
-            except Exception:
-                # Ignore errors with CPU frequency
-                pass
+        # Get CPU frequency (refreshed every _CPU_FREQ_CHECK_INTERVAL seconds)
+        current_freq = self._cpu_freq()
         
-        # Get CPU load average (1, 5, 15 minutes) - only if needed
-        load_avg = None
-        normalized_load_avg = None
-        if hasattr(os, 'getloadavg'):
-            try:
-                load_avg = os.getloadavg()
-                # Normalize load average by number of cores
-                normalized_load_avg = [round(load / cpu_count * 100, 2) for load in load_avg]
-            except Exception:
-                # Ignore errors with load average
-                pass
+        # Get CPU load average (1, 5, 15 minutes), shared between callers for _LOAD_AVG_CACHE_TTL
+        load_avg, normalized_load_avg = self._load_avg()
         
         # Get CPU model name (use cached value if available)
-        if _cpu_model_cache is None:
-            try:
-                if platform.system() == "Linux":
-                    with open('/proc/cpuinfo', 'r') as f:
-                        for line in f:
-                            if line.strip():
-                                if line.rstrip('\n').startswith('model name'):
-                                    model_name = line.rstrip('\n').split(':')[1].strip()
-                                    _cpu_model_cache = model_name
-                                    break
-                elif platform.system() == "Darwin":  # macOS
-                    import subprocess
-                    output = subprocess.check_output(['sysctl', '-n', 'machdep.cpu.brand_string']).decode().strip()
-                    _cpu_model_cache = output
-                else:
-                    _cpu_model_cache = platform.processor()
-                
-                # If we couldn't determine the model, use a default
-                if not _cpu_model_cache:
-                    _cpu_model_cache = platform.processor() or "Unknown CPU"
-            except Exception as e:
-                _cpu_model_cache = f"Unknown (Error: {str(e)})"
+        if self._cpu_model is None:
+            self._cpu_model = _read_cpu_model()
         
         return {
             "percent": normalized_percent,  # Use normalized percentage
             "raw_percent": cpu_percent,     # Keep the raw percentage for reference
-            "count": cpu_count,
-            "physical_cores": physical_cores,
+            "count": _CPU_COUNT,
+            "physical_cores": _PHYSICAL_CORES,
             "current_freq": current_freq,
             "load_avg": load_avg,
             "normalized_load_avg": normalized_load_avg,  # Add normalized load average
-            "model": _cpu_model_cache
-        }
-    except Exception as e:
-        return {
-            "error": str(e)
+            "model": self._cpu_model
         }
-
-# Cache for memory information
-_memory_info_cache = None
-_last_memory_check_time = 0
-_MEMORY_CACHE_TTL = 2  # Cache memory info for 2 seconds
-
-def get_memory_info() -> Dict[str, Any]:
-    """
-    Get memory information.
-    
-    Returns:
-        Dict[str, Any]: Dictionary with memory information
-    """
-    global _memory_info_cache, _last_memory_check_time
     
-    try:
-        current_time = time.time()
-        
-        # Use cached memory info if recent enough
-        if current_time - _last_memory_check_time <= _MEMORY_CACHE_TTL and _memory_info_cache:
-            return _memory_info_cache
+    def _read_memory_info(self) -> Dict[str, Any]:
+        """
+        Get memory information.
         
-        # Get virtual memory information
-        mem = psutil.virtual_memory()
+        Returns:
+            Dict[str, Any]: Dictionary with memory information
+        """
+        # Get virtual memory information; on Linux one read of /proc/meminfo
+        # covers memory and swap, where psutil would read it for each
+        meminfo = None
+        mem = None
+        if _IS_LINUX:
+            try:
+                meminfo = _read_meminfo()
+                mem = _linux_virtual_memory(meminfo)
+            except (OSError, KeyError, ValueError):
+                # Unusual /proc/meminfo; fall back to psutil's calculation
+                pass
+        if mem is None:
+            try:
+                vm = self._psutil_virtual_memory()
+            except _READ_ERRORS as e:
+                return {
+                    "error": str(e)
+                }
+            mem = {
+                "total": vm.total,
+                "available": vm.available,
+                "used": vm.used,
+                "percent": vm.percent
+            }
         
         # Get swap memory information - only if needed
-        swap_info = {"total": 0, "used": 0, "percent": 0}
+        swap_total = swap_used = swap_percent = 0
         try:
-            swap = psutil.swap_memory()
-            swap_info = {
-                "total": swap.total,
-                "used": swap.used,
-                "percent": swap.percent
-            }
-        except Exception:
+            if meminfo is not None:
+                # psutil.swap_memory() would read /proc/meminfo again, plus
+                # /proc/vmstat for page counts we don't report
+                total, free = meminfo["SwapTotal"], meminfo["SwapFree"]
+                swap_total, swap_used = total, total - free
+                swap_percent = round(swap_used / swap_total * 100, 1) if swap_total else 0.0
+            else:
+                swap = self._psutil_swap_memory()
+                swap_total, swap_used, swap_percent = swap.total, swap.used, swap.percent
+        except (KeyError, *_READ_ERRORS):
             # Ignore errors with swap memory
             pass
         
-        # Create result
-        result = {
-            "total": mem.total,
-            "available": mem.available,
-            "used": mem.used,
-            "percent": mem.percent,
-            "swap_total": swap_info["total"],
-            "swap_used": swap_info["used"],
-            "swap_percent": swap_info["percent"]
-        }
-        
-        # Update cache
-        _memory_info_cache = result
-        _last_memory_check_time = current_time
-        
-        return result
-    except Exception as e:
         return {
-            "error": str(e)
+            "total": mem["total"],
+            "available": mem["available"],
+            "used": mem["used"],
+            "percent": mem["percent"],
+            "swap_total": swap_total,
+            "swap_used": swap_used,
+            "swap_percent": swap_percent
         }
-
-# Cache for disk information
-_disk_info_cache = None
-_last_disk_check_time = 0
-_DISK_CACHE_TTL = 5  # Cache disk info for 5 seconds (disk usage changes slowly)
-
-def get_disk_info() -> Dict[str, Any]:
-    """
-    Get disk information.
     
-    Returns:
-        Dict[str, Any]: Dictionary with disk information
-    """
-    global _disk_info_cache, _last_disk_check_time
+    def memory_info(self) -> Dict[str, Any]:
+        """
+        Get memory information, cached for _MEMORY_CACHE_TTL.
+        
+        Returns:
+            Dict[str, Any]: Dictionary with memory information
+        """
+        return self._memory_info()
     
-    try:
-        current_time = time.time()
+    def _read_disk_io(self) -> Dict[str, Optional[int]]:
+        """
+        Get disk I/O counters summed over all disks.
         
-        # Use cached disk info if recent enough
-        if current_time - _last_disk_check_time <= _DISK_CACHE_TTL and _disk_info_cache:
-            return _disk_info_cache
+        Returns:
+            Dict[str, Optional[int]]: Read/write counts and bytes, None where unavailable
+        """
+        try:
+            disk_io = self._psutil_disk_io_counters()
+            if disk_io:
+                return {
+                    "read_count": disk_io.read_count,
+                    "write_count": disk_io.write_count,
+                    "read_bytes": disk_io.read_bytes,
+                    "write_bytes": disk_io.write_bytes
+                }
+        except _READ_ERRORS:
+            # Ignore errors with disk I/O
+            pass
+        return _EMPTY_DISK_IO
+    
+    def _read_disk_info(self) -> Dict[str, Any]:
+        """
+        Get disk information.
         
+        Returns:
+            Dict[str, Any]: Dictionary with disk information
+        """
         # Get disk usage for root partition
-        disk = psutil.disk_usage('/')
+        try:
+            disk = self._psutil_disk_usage('/')
+        except _READ_ERRORS as e:
+            return {
+                "error": str(e)
+            }
         
-        # Get disk I/O statistics - only if needed and not too frequently
-        io_info = {"read_count": None, "write_count": None, "read_bytes": None, "write_bytes": None}
-        if current_time % 10 < 1:  # Only check every ~10 seconds
-            try:
-                disk_io = psutil.disk_io_counters()
-                if disk_io:
-                    io_info = {
-                        "read_count": disk_io.read_count,
-                        "write_count": disk_io.write_count,
-                        "read_bytes": disk_io.read_bytes,
-                        "write_bytes": disk_io.write_bytes
-                    }
-            except Exception:
-                # Ignore errors with disk I/O
-                pass
+        # Get disk I/O statistics (refreshed every _DISK_IO_CHECK_INTERVAL seconds)
+        io_info = self._disk_io()
         
-        # Create result
-        result = {
+        return {
             "total": disk.total,
             "used": disk.used,
             "free": disk.free,
@@ -222,173 +583,280 @@ def get_disk_info() -> Dict[str, Any]:
             "read_bytes": io_info["read_bytes"],
             "write_bytes": io_info["write_bytes"]
         }
+    
+    def disk_info(self) -> Dict[str, Any]:
+        """
+        Get disk information, cached for _DISK_CACHE_TTL.
         
-        # Update cache
-        _disk_info_cache = result
-        _last_disk_check_time = current_time
+        Returns:
+            Dict[str, Any]: Dictionary with disk information
+        """
+        return self._disk_info()
+    
+    def _read_network_io(self) -> Dict[str, int]:
+        """
+        Get network I/O counters summed over all interfaces.
         
-        return result
-    except Exception as e:
+        Returns:
+            Dict[str, int]: Bytes and packets sent and received
+        """
+        net_io = self._psutil_net_io_counters()
+        if net_io is None:
+            # No network interfaces to sum over
+            return _EMPTY_NETWORK_IO
         return {
-            "error": str(e)
+            "bytes_sent": net_io.bytes_sent,
+            "bytes_recv": net_io.bytes_recv,
+            "packets_sent": net_io.packets_sent,
+            "packets_recv": net_io.packets_recv
         }
-
-# Cache for network interfaces to avoid repeated lookups
-_network_interfaces_cache = None
-_last_interfaces_update = 0
-_INTERFACES_CACHE_TTL = 60  # Cache network interfaces for 60 seconds
-
-# Cache for network I/O statistics
-_network_io_cache = None
-_last_network_io_update = 0
-_NETWORK_IO_CACHE_TTL = 1  # Cache network I/O for 1 second
-
-def get_network_info() -> Dict[str, Any]:
-    """
-    Get network information.
     
-    Returns:
-        Dict[str, Any]: Dictionary with network information
-    """
-    global _network_interfaces_cache, _last_interfaces_update
-    global _network_io_cache, _last_network_io_update
+    def _read_network_interfaces(self) -> List[Dict[str, Any]]:
+        """
+        Get the network interfaces that have an IPv4 address.
+        
+        Returns:
+            List[Dict[str, Any]]: Name, MAC address and IPv4 address of each interface
+        """
+        if _IS_LINUX:
+            return _linux_network_interfaces()
+        
+        af_link = psutil.AF_LINK
+        af_inet = socket.AF_INET
+        interfaces = []
+        for interface, addrs in self._psutil_net_if_addrs().items():
+            mac = None
+            ipv4 = None
+            
+            for addr in addrs:
+                family = addr.family
+                if family == af_link:  # MAC address
+                    mac = addr.address
+                elif family == af_inet:  # IPv4
+                    ipv4 = addr.address
+            
+            if ipv4:  # Only add interfaces with IPv4 addresses
+                interfaces.append({
+                    "name": interface,
+                    "mac": mac,
+                    "ipv4": ipv4
+                })
+        return interfaces
     
-    try:
-        current_time = time.time()
+    def network_info(self) -> Dict[str, Any]:
+        """
+        Get network information.
         
-        # Get network I/O statistics (use cached value if available and not expired)
-        if _network_io_cache is None or (current_time - _last_network_io_update) > _NETWORK_IO_CACHE_TTL:
-            try:
-                net_io = psutil.net_io_counters()
-                _network_io_cache = {
-                    "bytes_sent": net_io.bytes_sent,
-                    "bytes_recv": net_io.bytes_recv,
-                    "packets_sent": net_io.packets_sent,
-                    "packets_recv": net_io.packets_recv
-                }
-                _last_network_io_update = current_time
-            except Exception:
-                # Use default values if there's an error
-                if _network_io_cache is None:
-                    _network_io_cache = {
-                        "bytes_sent": 0,
-                        "bytes_recv": 0,
-                        "packets_sent": 0,
-                        "packets_recv": 0
-                    }
+        Returns:
+            Dict[str, Any]: Dictionary with network information
+        """
+        # Get network I/O statistics (cached for _NETWORK_IO_CACHE_TTL)
+        try:
+            network_io = self._network_io()
+        except _READ_ERRORS:
+            # Use default values if there's an error
+            network_io = _EMPTY_NETWORK_IO
         
         # Skip the expensive network connections count entirely
         connections = 0
         
-        # Get network interfaces (use cached value if available and not expired)
-        if _network_interfaces_cache is None or (current_time - _last_interfaces_update) > _INTERFACES_CACHE_TTL:
-            try:
-                interfaces = []
-                for interface, addrs in psutil.net_if_addrs().items():
-                    mac = None
-                    ipv4 = None
-                    
-                    for addr in addrs:
-                        if addr.family == psutil.AF_LINK:  # MAC address
-                            mac = addr.address
-                        elif addr.family == 2:  # IPv4
-                            ipv4 = addr.address
-                    
-                    if ipv4:  # Only add interfaces with IPv4 addresses
-                        interfaces.append({
-                            "name": interface,
-                            "mac": mac,
-                            "ipv4": ipv4
-                        })
-                
-                _network_interfaces_cache = interfaces
-                _last_interfaces_update = current_time
-            except Exception:
-                # Use empty list if there's an error
-                if _network_interfaces_cache is None:
-                    _network_interfaces_cache = []
+        # Get network interfaces (cached for _INTERFACES_CACHE_TTL)
+        try:
+            interfaces = self._network_interfaces()
+        except _READ_ERRORS:
+            # Use empty list if there's an error
+            interfaces = []
         
         return {
-            "bytes_sent": _network_io_cache["bytes_sent"],
-            "bytes_recv": _network_io_cache["bytes_recv"],
-            "packets_sent": _network_io_cache["packets_sent"],
-            "packets_recv": _network_io_cache["packets_recv"],
+            "bytes_sent": network_io["bytes_sent"],
+            "bytes_recv": network_io["bytes_recv"],
+            "packets_sent": network_io["packets_sent"],
+            "packets_recv": network_io["packets_recv"],
             "connections": connections,
-            "interfaces": _network_interfaces_cache
+            "interfaces": interfaces
         }
-    except Exception as e:
-        return {
-            "error": str(e)
-        }
-
-def get_system_uptime() -> Dict[str, Any]:
-    """
-    Get system uptime.
     
-    Returns:
-        Dict[str, Any]: Dictionary with system uptime information
-    """
-    try:
+    def uptime(self) -> Dict[str, Any]:
+        """
+        Get system uptime.
+        
+        Returns:
+            Dict[str, Any]: Dictionary with system uptime information
+        """
         # Get boot time
-        boot_time = psutil.boot_time()
+        try:
+            boot_time = self._psutil_boot_time()
+        except _READ_ERRORS as e:
+            return {
+                "error": str(e)
+            }
         uptime_seconds = time.time() - boot_time
         
-        # Calculate days, hours, minutes, seconds
-        days, remainder = divmod(uptime_seconds, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        # The formatted string only changes once a second, so callers polling
+        # within the same second reuse it
+        whole_seconds = int(uptime_seconds)
+        cached_seconds, uptime_formatted = self._uptime_formatted
+        if whole_seconds != cached_seconds:
+            # Calculate days, hours, minutes, seconds
+            days, remainder = divmod(whole_seconds, 86400)
+            hours, remainder = divmod(remainder, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            uptime_formatted = f"{days}d {hours}h {minutes}m {seconds}s"
+            self._uptime_formatted = (whole_seconds, uptime_formatted)
         
         return {
             "boot_time": boot_time,
             "uptime_seconds": uptime_seconds,
-            "uptime_formatted": f"{int(days)}d {int(hours)}h {int(minutes)}m {int(seconds)}s"
+            "uptime_formatted": uptime_formatted
         }
-    except Exception as e:
+    
+    def _read_all_info(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all system information.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary with all system information
+        """
+        # Collect all system information
         return {
-            "error": str(e)
+            "cpu": self.cpu_info(),
+            "memory": self.memory_info(),
+            "disk": self.disk_info(),
+            "network": self.network_info(),
+            "uptime": self.uptime(),
+            "platform": get_platform_info()
         }
+    
+    def _refresh_snapshots(self) -> None:
+        """
+        Collect a new snapshot every _SNAPSHOT_INTERVAL seconds until nobody
+        has read one for _SNAPSHOT_IDLE_TIMEOUT seconds.
+        """
+        while True:
+            time.sleep(_SNAPSHOT_INTERVAL)
+            with self._refresher_lock:
+                if time.monotonic() - self._last_snapshot_read > _SNAPSHOT_IDLE_TIMEOUT:
+                    self._refresher = None
+                    return
+            try:
+                self._snapshot = self._read_all_info()
+            except Exception:
+                # Keep serving the previous snapshot rather than stopping
+                logger.exception("Error collecting system information")
+    
+    def all_info(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all system information from the latest background snapshot.
+        
+        The first call collects a snapshot directly and starts a daemon
+        thread that replaces it every _SNAPSHOT_INTERVAL seconds while it
+        is being read, so later calls don't read anything from the system.
+        
+        The returned dict is shared by every caller until the next snapshot and
+        must not be modified.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary with all system information
+        """
+        self._last_snapshot_read = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is None or self._refresher is None:
+            with self._refresher_lock:
+                if self._refresher is None:
+                    # Not refreshing, so the snapshot (if any) is out of date
+                    self._snapshot = self._read_all_info()
+                    self._refresher = threading.Thread(
+                        target=self._refresh_snapshots,
+                        name="SystemInfoRefresher",
+                        daemon=True
+                    )
+                    self._refresher.start()
+                snapshot = self._snapshot
+        return snapshot
+    
+    def all_info_json(self) -> str:
+        """
+        Get all system information rendered as JSON.
+        
+        The JSON is rendered once per snapshot, so pollers between two
+        snapshots get the same string back without it being serialized
+        again.
+        
+        Returns:
+            str: JSON object with all system information
+        """
+        info = self.all_info()
+        cached_info, cached_json = self._all_info_json
+        if cached_info is not info:
+            cached_json = json.dumps(info)
+            self._all_info_json = (info, cached_json)
+        return cached_json
 
-# Cache for complete system info
-_all_system_info_cache = None
-_last_all_info_update = 0
-_ALL_INFO_CACHE_TTL = 1  # Cache all system info for 1 second
+# Shared collector behind the module-level functions
+_collector = SystemInfoCollector()
 
-def get_all_system_info() -> Dict[str, Dict[str, Any]]:
+def get_cpu_info() -> Dict[str, Any]:
+    """
+    Get CPU information.
+    
+    Returns:
+        Dict[str, Any]: Dictionary with CPU information
     """
-    Get all system information.
+    return _collector.cpu_info()
+
+def get_memory_info() -> Dict[str, Any]:
+    """
+    Get memory information.
     
     Returns:
-        Dict[str, Dict[str, Any]]: Dictionary with all system information
+        Dict[str, Any]: Dictionary with memory information
+    """
+    return _collector.memory_info()
+
+def get_disk_info() -> Dict[str, Any]:
     """
-    global _all_system_info_cache, _last_all_info_update
+    Get disk information.
     
-    current_time = time.time()
+    Returns:
+        Dict[str, Any]: Dictionary with disk information
+    """
+    return _collector.disk_info()
+
+def get_network_info() -> Dict[str, Any]:
+    """
+    Get network information.
     
-    # Use cached info if recent enough
-    if _all_system_info_cache is not None and (current_time - _last_all_info_update) <= _ALL_INFO_CACHE_TTL:
-        return _all_system_info_cache
+    Returns:
+        Dict[str, Any]: Dictionary with network information
+    """
+    return _collector.network_info()
+
+def get_system_uptime() -> Dict[str, Any]:
+    """
+    Get system uptime.
     
-    # Get platform info only once per application run
-    platform_info = {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor()
-    }
+    Returns:
+        Dict[str, Any]: Dictionary with system uptime information
+    """
+    return _collector.uptime()
+
+def get_all_system_info() -> Dict[str, Dict[str, Any]]:
+    """
+    Get all system information, as of the latest background snapshot.
     
-    # Collect all system information
-    result = {
-        "cpu": get_cpu_info(),
-        "memory": get_memory_info(),
-        "disk": get_disk_info(),
-        "network": get_network_info(),
-        "uptime": get_system_uptime(),
-        "platform": platform_info
-    }
+    The returned dict is shared by every caller until the next snapshot and
+    must not be modified.
     
-    # Update cache
-    _all_system_info_cache = result
-    _last_all_info_update = current_time
+    Returns:
+        Dict[str, Dict[str, Any]]: Dictionary with all system information
+    """
+    return _collector.all_info()
+
+def get_all_system_info_json() -> str:
+    """
+    Get all system information rendered as JSON.
     
-    return result
\ No newline at end of file
+    Returns:
+        str: JSON object with all system information
+    """
+    return _collector.all_info_json()
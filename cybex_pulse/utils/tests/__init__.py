@@ -0,0 +1,3 @@
+"""
+Test modules for the shared utilities.
+"""
@@ -0,0 +1,112 @@
+"""
+Tests for the debug logger.
+"""
+import gc
+import logging
+import threading
+
+import pytest
+
+from cybex_pulse.utils.config import Config
+from cybex_pulse.utils.debug_logger import DebugLogger
+
+
+@pytest.fixture
+def debug_logger(tmp_path):
+    """DebugLogger on a fresh configuration with debug logging disabled."""
+    logger = logging.getLogger("cybex_pulse.tests.debug_logger")
+    logger.setLevel(logging.DEBUG)
+    config = Config(tmp_path / "config.json")
+    config.set("general", "debug_logging", False)
+    return DebugLogger(logger, config)
+
+
+def test_toggling_setting_reenables_debug(debug_logger, caplog):
+    """Test that turning the setting on at runtime takes effect without a restart."""
+    debug_logger.debug("while disabled")
+    assert "while disabled" not in caplog.text
+    
+    debug_logger.config.set("general", "debug_logging", True)
+    assert debug_logger.is_debug_enabled()
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.logger.name):
+        debug_logger.debug("while enabled")
+    assert "while enabled" in caplog.text
+
+
+def test_toggling_setting_disables_debug(debug_logger, caplog):
+    """Test that turning the setting off at runtime silences debug()."""
+    debug_logger.config.set("general", "debug_logging", True)
+    debug_logger.config.set("general", "debug_logging", False)
+    assert not debug_logger.is_debug_enabled()
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.logger.name):
+        debug_logger.debug("after disabling")
+    assert "after disabling" not in caplog.text
+
+
+def test_debug_lock_holds_lock_and_logs_after_release(debug_logger, caplog):
+    """Test that debug_lock holds the lock in the block and logs once it is released."""
+    lock = threading.Lock()
+    debug_logger.config.set("general", "debug_logging", True)
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.logger.name):
+        with debug_logger.debug_lock(lock, "test_lock"):
+            assert lock.locked()
+            assert "test_lock" not in caplog.text
+    assert not lock.locked()
+    assert "Lock test_lock: waited" in caplog.text
+
+
+def test_debug_lock_without_debugging(debug_logger, caplog):
+    """Test that debug_lock is a plain lock while debug logging is off."""
+    lock = threading.Lock()
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.logger.name):
+        with debug_logger.debug_lock(lock, "test_lock"):
+            assert lock.locked()
+    assert not lock.locked()
+    assert "test_lock" not in caplog.text
+
+
+def test_thread_manager_logs_thread_pool_lock(debug_logger, caplog):
+    """Test that ThreadManager takes its thread pool lock through debug_lock."""
+    # Importing anything from cybex_pulse.core loads the whole application
+    pytest.importorskip("flask")
+    from cybex_pulse.core.thread_manager import ThreadManager
+    
+    debug_logger.config.set("general", "debug_logging", True)
+    manager = ThreadManager(debug_logger.logger, debug_logger.config)
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.logger.name):
+        thread = manager.create_thread("worker", lambda: None)
+        thread.start()
+        thread.join()
+    
+    lock_messages = [r.getMessage() for r in caplog.records if "Lock thread_pool_lock" in r.getMessage()]
+    assert len(lock_messages) == 2  # Incrementing and decrementing the active count
+    assert manager.active_thread_count == 0
+
+
+class _Resource:
+    """Stand-in for a socket or file, which can be weakly referenced."""
+
+
+def test_collected_resource_is_forgotten(debug_logger):
+    """Test that a garbage collected resource stops being tracked."""
+    debug_logger.config.set("general", "debug_logging", True)
+    resource = _Resource()
+    debug_logger.track_resource("socket", resource)
+    assert [name for name, _ in debug_logger.tracked_resources()] == ["socket"]
+    
+    del resource
+    gc.collect()
+    assert debug_logger.tracked_resources() == []
+    assert debug_logger._resource_trackers == {}
+
+
+def test_collected_resource_does_not_forget_retracked_name(debug_logger):
+    """Test that collecting a resource keeps a newer resource tracked under the same name."""
+    debug_logger.config.set("general", "debug_logging", True)
+    first, second = _Resource(), _Resource()
+    debug_logger.track_resource("socket", first)
+    debug_logger.track_resource("socket", second)
+    
+    del first
+    gc.collect()
+    assert [name for name, _ in debug_logger.tracked_resources()] == ["socket"]
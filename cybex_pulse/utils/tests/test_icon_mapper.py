@@ -0,0 +1,40 @@
+"""
+Tests for the device icon mapper.
+"""
+import pytest
+
+from cybex_pulse.utils.icon_mapper import IconMapper
+
+
+@pytest.mark.parametrize("device_name, icon", [
+    ("PlayStation4", ('fab', 'playstation')),
+    ("PlayStation 5", ('fab', 'playstation')),
+    ("Xbox360", ('fab', 'xbox')),
+    ("iPhone12", ('fab', 'apple')),
+    ("Living Room TV", ('fas', 'tv')),
+    ("Kitchen Speakers", ('fas', 'volume-up')),
+])
+def test_keyword_in_device_name(device_name, icon):
+    """Test that keywords are found as words, including before a model number."""
+    assert IconMapper().get_icon_for_device(None, device_name) == icon
+
+
+@pytest.mark.parametrize("device_name, icon", [
+    ("raspberrypi", ('fab', 'raspberry-pi')),
+    ("AppleTV", ('fab', 'apple')),
+    ("NintendoSwitch", ('fab', 'nintendo-switch')),
+    ("SonosZP", ('fas', 'volume-up')),
+])
+def test_brand_run_together_with_other_words(device_name, icon):
+    """Test that brand names are found inside hostnames that join words together."""
+    assert IconMapper().get_icon_for_device(None, device_name) == icon
+
+
+@pytest.mark.parametrize("device_name", [
+    "manufacturing",  # Contains "ring"
+    "LGwebOSTV",  # "tv" run together with other letters
+])
+def test_keyword_inside_word_not_matched(device_name):
+    """Test that a keyword inside a longer word doesn't decide the icon."""
+    mapper = IconMapper()
+    assert mapper.get_icon_for_device(None, device_name) == mapper.get_icon_for_device(None, None)
@@ -4,30 +4,122 @@ Version check module for Cybex Pulse.
 This module provides functionality to check for updates by comparing the
 local Git commit hash with the latest commit on the main branch.
 """
+import contextlib
 import json
 import logging
 import os
 import platform
+import re
+import shutil
+import stat
 import subprocess
 import threading
 import time
-from typing import Dict, Optional, Tuple, Union
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from cybex_pulse.utils.version_manager import version_manager
 
+# requests (with urllib3, idna and charset_normalizer) is only imported once
+# an update check runs, so it stays out of startup
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# Where the application is installed, for when it isn't at /opt/pulse
+_REPO_DIR_FALLBACK = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+_PULSE_SCRIPT_FALLBACK = os.path.join(_REPO_DIR_FALLBACK, "pulse")
+
+# Result of _get_repo_dir, looked up on first use
+_repo_dir = None
+
+def _get_repo_dir() -> str:
+    """Get the application's git repository directory.
+    
+    The install location doesn't change while the application runs, so it
+    is only looked up once.
+    
+    Returns:
+        str: /opt/pulse if it exists, otherwise the directory this package is installed in
+    """
+    global _repo_dir
+    if _repo_dir is None:
+        if os.path.exists('/opt/pulse'):
+            _repo_dir = '/opt/pulse'
+        else:
+            # Fall back to try relative path resolution if not at standard location
+            _repo_dir = _REPO_DIR_FALLBACK
+    return _repo_dir
+
+# Interpreters for the restart scripts that aren't started directly, by file
+# name; these are run from /opt/pulse
+_RESTART_INTERPRETERS = {
+    "pulse": ["/bin/bash"],
+    "run_app.py": ["/usr/bin/python3"]
+}
+
+# (connect, read) timeouts in seconds for GitHub API requests
+_REQUEST_TIMEOUT = (3.05, 7)
+
+# Head of main and the newest tag, for checks made with a GitHub token
+_LATEST_REFS_QUERY = """
+{
+  repository(owner: "DigitalPals", name: "pulse") {
+    ref(qualifiedName: "refs/heads/main") {
+      target { oid }
+    }
+    refs(refPrefix: "refs/tags/", first: 1, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) {
+      nodes { name }
+    }
+  }
+}
+"""
+
+# A successful check's result is reused for this many seconds unless forced
+_CHECK_CACHE_SECONDS = 60
+
+# GitHub ETags, with the values read from the responses they identify, kept
+# across restarts so the first check after a restart can be conditional too
+_ETAG_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "cybex-pulse", "etags.json")
+
+# Stop checking until the rate limit resets once fewer requests than this are left
+_RATE_LIMIT_MIN_REMAINING = 5
+
+# Each consecutive failed check doubles the wait before the next one, for up
+# to this many failures and never beyond _MAX_CHECK_BACKOFF seconds
+_MAX_BACKOFF_FAILURES = 6
+_MAX_CHECK_BACKOFF = 24 * 3600
+
+# A full SHA-1 or SHA-256 object name
+_SHA_RE = re.compile(r'[0-9a-f]{40}(?:[0-9a-f]{24})?')
+
+# Number of leading hex digits compared when checking for a newer commit
+_SHORT_SHA_LENGTH = 12
+
+def _short_sha(sha: str) -> str:
+    """Normalise a commit hash for comparison.
+    
+    Args:
+        sha: Full or abbreviated commit hash
+        
+    Returns:
+        str: First _SHORT_SHA_LENGTH lowercase hex digits of the hash
+    """
+    return sha.strip().lower()[:_SHORT_SHA_LENGTH]
+
 class UpdateChecker:
     """Check for updates to the Cybex Pulse application."""
     
-    def __init__(self, check_interval: int = 3600, logger=None):
+    def __init__(self, check_interval: int = 3600, logger=None, github_token: Optional[str] = None):
         """Initialize the update checker.
         
         Args:
             check_interval: Interval in seconds between update checks (default: 3600)
             logger: Logger instance
+            github_token: GitHub token for API requests (default: the GITHUB_TOKEN
+                          environment variable). With a token, each check is a
+                          single GraphQL query instead of two REST requests.
         """
         self.check_interval = check_interval
         self.logger = logger or logging.getLogger(__name__)
@@ -35,58 +127,360 @@ class UpdateChecker:
         self.stop_event = threading.Event()
         self.update_available = False
         self.latest_commit_hash = None
+        # Last commit hash read from git, with the HEAD file times it was read at
+        self._head_mtimes = None
+        self._cached_head = None
+        # git is run by absolute path; without it the installation is treated
+        # as a non-git one, as it can't be updated
+        self._git = shutil.which('git')
+        if not self._git:
+            self.logger.warning("git is not installed. Update checks disabled.")
         self.current_commit_hash = self.get_current_commit_hash()  # Use our own method instead
         self.current_version = version_manager.get_version()
         self.latest_version = None
         self.update_error = None
         self.last_checked = None
+        self._last_checked_monotonic = None
+        
+        self._github_token = github_token or os.environ.get("GITHUB_TOKEN")
+        # Session for GitHub API requests, created by the first check
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # Platform and executable for restart_application, looked up once
+        self._system = platform.system().lower()
+        self._restart_executable = self._find_restart_executable()
+        
+        # Cache key -> {"etag": ..., "value": ...} for conditional requests
+        self._etags = self._load_etags()
+        self._etags_lock = threading.Lock()
+        
+        # Monotonic time before which GitHub asked us not to send more requests
+        self._rate_limited_until = None
+        # GitHub requests that have failed in a row, for the checker's backoff
+        self._consecutive_failures = 0
+        
+        # Held while checking for or applying an update
+        self._op_lock = threading.Lock()
+    
+    def _get_session(self) -> 'requests.Session':
+        """Get the session for GitHub API requests, creating it on first use.
+        
+        One session is used for all requests, so checks reuse an open TLS
+        connection instead of handshaking for every request.
+        
+        Returns:
+            requests.Session: Session with GitHub headers and retries set up
+        """
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                session.headers.update({
+                    "User-Agent": "cybex-pulse",
+                    "Accept": "application/vnd.github+json"
+                })
+                if self._github_token:
+                    session.headers["Authorization"] = f"Bearer {self._github_token}"
+                # Retry GitHub's transient server errors; rate limiting (429) is
+                # left to _note_rate_limit so a long Retry-After can't block a check.
+                # POST is included because the GraphQL query is read-only.
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=retry)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+    
+    def _load_etags(self) -> Dict[str, Dict[str, Any]]:
+        """Load the saved GitHub ETags.
+        
+        Returns:
+            dict: Saved ETags and values by cache key, empty if none could be read
+        """
+        try:
+            with open(_ETAG_CACHE_PATH, 'r') as f:
+                etags = json.load(f)
+            return etags if isinstance(etags, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_etags(self) -> None:
+        """Save the GitHub ETags for the next run."""
+        try:
+            os.makedirs(os.path.dirname(_ETAG_CACHE_PATH), exist_ok=True)
+            with open(_ETAG_CACHE_PATH, 'w') as f:
+                json.dump(self._etags, f)
+        except OSError as e:
+            self.logger.debug(f"Failed to save GitHub ETags: {e}")
+    
+    def _get_github(self, key: str, url: str, extract: Callable[['requests.Response'], Any],
+                    params: Optional[Dict[str, Any]] = None, accept: Optional[str] = None) -> Any:
+        """Fetch a GitHub API resource, revalidating the previous response with its ETag.
+        
+        GitHub answers an unchanged resource with 304 Not Modified, which has
+        no body and doesn't count against the rate limit; the value read from
+        the earlier response is reused in that case.
+        
+        Args:
+            key: Cache key for the resource's ETag and value
+            url: GitHub API URL
+            extract: Function reading the wanted value from the response
+            params: Optional query parameters
+            accept: Optional media type to request instead of the session's JSON default
+            
+        Returns:
+            The extracted value
+            
+        Raises:
+            requests.RequestException: If the request fails
+            json.JSONDecodeError: If extract decodes a response that isn't valid JSON
+        """
+        headers = {}
+        if accept:
+            headers["Accept"] = accept
+        cached = self._etags.get(key)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+        response = self._get_session().get(url, params=params, headers=headers, timeout=_REQUEST_TIMEOUT)
+        self._note_rate_limit(response)
+        if response.status_code == 304 and cached:
+            return cached["value"]
+        
+        response.raise_for_status()
+        value = extract(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etags_lock:
+                self._etags[key] = {"etag": etag, "value": value}
+                self._save_etags()
+        return value
+    
+    def _note_rate_limit(self, response: 'requests.Response') -> None:
+        """Hold off further checks if a GitHub response asks for it.
+        
+        A Retry-After header, or fewer than _RATE_LIMIT_MIN_REMAINING requests
+        left in the current window, postpones checks until GitHub says more
+        requests are allowed.
+        
+        Args:
+            response: Response from the GitHub API
+        """
+        headers = response.headers
+        delay = None
+        try:
+            if "Retry-After" in headers:
+                delay = int(headers["Retry-After"])
+            elif int(headers.get("X-RateLimit-Remaining", _RATE_LIMIT_MIN_REMAINING)) < _RATE_LIMIT_MIN_REMAINING:
+                delay = int(headers.get("X-RateLimit-Reset", 0)) - time.time()
+        except ValueError:
+            return
+        if delay is None or delay <= 0:
+            return
+        
+        self.logger.warning(f"GitHub rate limit reached, postponing update checks for {int(delay)} seconds")
+        self._rate_limited_until = time.monotonic() + delay
+    
+    def _rate_limit_delay(self) -> float:
+        """Get the number of seconds until GitHub allows requests again.
+        
+        Returns:
+            float: Seconds left, or 0 if requests aren't being held off
+        """
+        if self._rate_limited_until is None:
+            return 0
+        return max(0, self._rate_limited_until - time.monotonic())
+    
+    def _get_head_mtimes(self, git_dir: str) -> Optional[Tuple[Optional[int], ...]]:
+        """Get the modification times of the files that decide what HEAD points at.
+        
+        Args:
+            git_dir: Path of the repository's .git directory
+            
+        Returns:
+            tuple: Modification times in nanoseconds of HEAD and, if HEAD names a
+                   branch, of the branch's ref file and packed-refs (None for
+                   either that doesn't exist), or None if HEAD can't be read
+        """
+        head_path = os.path.join(git_dir, 'HEAD')
+        try:
+            mtimes = [os.stat(head_path).st_mtime_ns]
+            with open(head_path, 'r') as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        
+        if head.startswith('ref: '):
+            for path in (os.path.join(git_dir, head[5:]), os.path.join(git_dir, 'packed-refs')):
+                try:
+                    mtimes.append(os.stat(path).st_mtime_ns)
+                except OSError:
+                    mtimes.append(None)
+        return tuple(mtimes)
+    
+    def _read_head_sha(self, git_dir: str) -> Optional[str]:
+        """Read the commit hash HEAD points at straight from the .git directory.
+        
+        Args:
+            git_dir: Path of the repository's .git directory
+            
+        Returns:
+            str: Commit hash, or None if it couldn't be resolved from the files
+        """
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), 'r') as f:
+                head = f.read().strip()
+            if not head.startswith('ref: '):
+                # Detached HEAD holds the hash itself
+                sha = head
+            else:
+                ref = head[5:]
+                try:
+                    with open(os.path.join(git_dir, ref), 'r') as f:
+                        sha = f.read().strip()
+                except FileNotFoundError:
+                    # The branch has been packed into packed-refs
+                    sha = None
+                    with open(os.path.join(git_dir, 'packed-refs'), 'r') as f:
+                        for line in f:
+                            fields = line.split()
+                            if len(fields) == 2 and fields[1] == ref:
+                                sha = fields[0]
+                                break
+        except OSError:
+            return None
+        
+        if sha and _SHA_RE.fullmatch(sha):
+            return sha
+        return None
     
     def get_current_commit_hash(self) -> Optional[str]:
         """Get the current Git commit hash.
         
+        The hash is only read again once HEAD or the branch it points at has
+        been modified since the last read.
+        
         Returns:
             str: Current commit hash or None if an error occurred
         """
         try:
             # Get expected git repository location (always at /opt/pulse)
-            repo_dir = '/opt/pulse'
-            if not os.path.exists(repo_dir):
-                # Fall back to try relative path resolution if not at standard location
-                repo_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+            repo_dir = _get_repo_dir()
             
-            # Check if we're in a git repository - specify the repo directory explicitly
-            repo_check = subprocess.run(
-                ['git', '-C', repo_dir, 'rev-parse', '--is-inside-work-tree'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            if not self._git:
+                return self._fallback_commit_id()
             
-            # If not a git repository, return a fallback identifier
-            if repo_check.returncode != 0:
+            # If not a git repository, return a fallback identifier. .git is a
+            # directory in a normal clone and a file in a worktree
+            git_dir = os.path.join(repo_dir, '.git')
+            if not os.path.exists(git_dir):
                 self.logger.warning("Not running from a git repository. Using fallback version identifier.")
-                # Use the modification time of the main script as a fallback version
-                script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../pulse"))
-                if os.path.exists(script_path):
-                    return f"install-{int(os.path.getmtime(script_path))}"
-                return "unknown"
+                return self._fallback_commit_id()
+            
+            head_mtimes = self._get_head_mtimes(git_dir) if os.path.isdir(git_dir) else None
+            if head_mtimes is not None:
+                if head_mtimes == self._head_mtimes and self._cached_head:
+                    return self._cached_head
+                
+                # Resolve HEAD from the files, leaving git for unusual layouts
+                sha = self._read_head_sha(git_dir)
+                if sha:
+                    self._head_mtimes = head_mtimes
+                    self._cached_head = sha
+                    return sha
                 
             # Run git rev-parse to get current commit hash - specify the repo directory explicitly
             result = subprocess.run(
-                ['git', '-C', repo_dir, 'rev-parse', 'HEAD'],
+                [self._git, '-C', repo_dir, 'rev-parse', 'HEAD'],
                 check=True,
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            return result.stdout.strip()
+            self._head_mtimes = head_mtimes
+            self._cached_head = result.stdout.strip()
+            return self._cached_head
         except subprocess.SubprocessError as e:
             self.logger.error(f"Failed to get current commit hash: {e}")
-            # Use fallback version identifier
-            script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../pulse"))
-            if os.path.exists(script_path):
-                return f"install-{int(os.path.getmtime(script_path))}"
-            return "unknown"
+            return self._fallback_commit_id()
+    
+    def _fallback_commit_id(self) -> str:
+        """Get the version identifier used in place of a commit hash outside git.
+        
+        Returns:
+            str: "install-" followed by the main script's modification time, or
+                 "unknown" if the script isn't there
+        """
+        script_path = _PULSE_SCRIPT_FALLBACK
+        if os.path.exists(script_path):
+            return f"install-{int(os.path.getmtime(script_path))}"
+        return "unknown"
+    
+    def _query_latest_refs(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the head of main and the newest tag with one GitHub GraphQL query.
+        
+        The GraphQL API only accepts authenticated requests, so this needs a
+        GitHub token.
+        
+        Returns:
+            tuple: (latest_commit_hash, latest_tag), with latest_tag None if there are no tags
+            
+        Raises:
+            requests.RequestException: If the request fails or GitHub reports an error
+            json.JSONDecodeError: If the response isn't valid JSON
+        """
+        import requests
+        
+        response = self._get_session().post(
+            'https://api.github.com/graphql',
+            json={"query": _LATEST_REFS_QUERY},
+            timeout=_REQUEST_TIMEOUT
+        )
+        self._note_rate_limit(response)
+        response.raise_for_status()
+        result = response.json()
+        repository = (result.get('data') or {}).get('repository')
+        if not repository:
+            raise requests.RequestException(f"GraphQL query failed: {result.get('errors')}")
+        
+        main = repository.get('ref') or {}
+        latest_hash = (main.get('target') or {}).get('oid')
+        tags = (repository.get('refs') or {}).get('nodes') or []
+        latest_tag = tags[0].get('name', '') if tags else None
+        return latest_hash, latest_tag
+    
+    def _commit_sha(self, response: 'requests.Response') -> Optional[str]:
+        """Read the commit hash from a commits response in the sha media type.
+        
+        Args:
+            response: Plain text response from the commits endpoint
+            
+        Returns:
+            str: The commit hash, or None if the body isn't one (an error page
+                 from a proxy, for example)
+        """
+        sha = response.text.strip()
+        return sha if _SHA_RE.fullmatch(sha) else None
+    
+    def _newest_tag_name(self, response: 'requests.Response') -> Optional[str]:
+        """Read the newest tag's name from a GitHub tags response.
+        
+        Args:
+            response: Response from the tags endpoint
+            
+        Returns:
+            str: Name of the first tag listed, or None if there are no tags
+        """
+        tags_data = response.json()
+        return tags_data[0].get('name', '') if tags_data else None
     
     def get_latest_commit_hash(self) -> Tuple[Optional[str], Optional[str]]:
         """Get the latest commit hash and version from GitHub.
@@ -94,35 +488,47 @@ class UpdateChecker:
         Returns:
             tuple: (latest_commit_hash, latest_version) or (None, None) if an error occurred
         """
+        import requests
+        
         try:
-            # Use GitHub API to get latest commit hash
-            commit_response = requests.get(
-                'https://api.github.com/repos/DigitalPals/pulse/commits/main',
-                timeout=10
-            )
-            commit_response.raise_for_status()
-            commit_data = commit_response.json()
-            latest_hash = commit_data.get('sha')
-            
-            # Try to get latest version from tags
-            try:
-                tags_response = requests.get(
-                    'https://api.github.com/repos/DigitalPals/pulse/tags',
-                    timeout=10
-                )
-                tags_response.raise_for_status()
-                tags_data = tags_response.json()
+            if self._github_token:
+                # One GraphQL query answers both the commit and the tag
+                latest_hash, latest_tag = self._query_latest_refs()
+            else:
+                # Request the latest commit hash and tags at the same time.
+                # The sha media type returns just the hash as plain text
+                # instead of the whole commit object
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    commit_future = executor.submit(
+                        self._get_github,
+                        'commits',
+                        'https://api.github.com/repos/DigitalPals/pulse/commits/main',
+                        self._commit_sha,
+                        accept='application/vnd.github.sha'
+                    )
+                    # Get the most recent tag, or None if there are no tags
+                    tags_future = executor.submit(
+                        self._get_github,
+                        'tags',
+                        'https://api.github.com/repos/DigitalPals/pulse/tags',
+                        self._newest_tag_name,
+                        params={"per_page": 1}
+                    )
                 
-                if tags_data and len(tags_data) > 0:
-                    # Get the most recent tag
-                    latest_tag = tags_data[0].get('name', '')
-                    # Remove 'v' prefix if present
-                    latest_version = latest_tag[1:] if latest_tag.startswith('v') else latest_tag
-                else:
-                    # If no tags, use commit hash as version
-                    latest_version = latest_hash[:7]
-            except (requests.RequestException, json.JSONDecodeError) as e:
-                self.logger.warning(f"Failed to get latest tag from GitHub: {e}")
+                latest_hash = commit_future.result()
+                
+                # The version from tags is optional
+                try:
+                    latest_tag = tags_future.result()
+                except (requests.RequestException, json.JSONDecodeError) as e:
+                    self.logger.warning(f"Failed to get latest tag from GitHub: {e}")
+                    return latest_hash, latest_hash[:7] if latest_hash else None
+            
+            if latest_tag is not None:
+                # Remove 'v' prefix if present
+                latest_version = latest_tag[1:] if latest_tag.startswith('v') else latest_tag
+            else:
+                # If no tags, use commit hash as version
                 latest_version = latest_hash[:7] if latest_hash else None
                 
             return latest_hash, latest_version
@@ -130,48 +536,187 @@ class UpdateChecker:
             self.logger.error(f"Failed to get latest commit hash from GitHub: {e}")
             return None, None
     
-    def check_for_updates(self) -> Tuple[bool, Optional[str]]:
+    def check_for_updates(self, force: bool = False) -> Tuple[bool, Optional[str]]:
         """Check if updates are available.
         
+        A successful check from the last _CHECK_CACHE_SECONDS seconds is
+        reused, so a manual check right after a scheduled one doesn't go
+        back to GitHub.
+        
+        Args:
+            force: Check even if a recent result is available
+            
         Returns:
             tuple: (update_available, error_message)
         """
-        self.update_error = None
-        self.last_checked = time.time()
+        # Checks and updates share state and the repository, so run one at a time
+        with self._op_lock:
+            if (not force and self.update_error is None and self._last_checked_monotonic is not None
+                    and time.monotonic() - self._last_checked_monotonic < _CHECK_CACHE_SECONDS):
+                return self.update_available, None
+            
+            self.update_error = None
+            self.last_checked = time.time()
+            self._last_checked_monotonic = time.monotonic()
+            
+            # Get current commit hash for comparison
+            self.current_commit_hash = self.get_current_commit_hash()
+            if not self.current_commit_hash:
+                self.update_error = "Failed to get current commit hash"
+                return False, self.update_error
+                
+            # Check if we're using a fallback version (not a git repository)
+            if self.current_commit_hash.startswith("install-") or self.current_commit_hash == "unknown":
+                self.logger.info("Using non-git installation. Update checks disabled.")
+                self.update_available = False
+                return False, None
+            
+            # Keep the previous result while GitHub is rate limiting us
+            if self._rate_limit_delay():
+                self.logger.info("Skipping update check until the GitHub rate limit resets")
+                return self.update_available, None
+            
+            # Get latest commit hash and version
+            result = self.get_latest_commit_hash()
+            if not result[0]:  # First element is commit hash
+                self._consecutive_failures = min(self._consecutive_failures + 1, _MAX_BACKOFF_FAILURES)
+                self.update_error = "Failed to get latest commit hash from GitHub"
+                return False, self.update_error
+                
+            self._consecutive_failures = 0
+            self.latest_commit_hash, self.latest_version = result
+            
+            # Compare hashes by prefix, so surrounding whitespace or an abbreviated
+            # hash from either side doesn't look like an update
+            self.update_available = _short_sha(self.current_commit_hash) != _short_sha(self.latest_commit_hash)
+            
+            # Log version information
+            self.logger.info(f"Current version: {self.current_version}")
+            if self.latest_version:
+                self.logger.info(f"Latest version available: {self.latest_version}")
+            self.logger.info(f"Update available: {self.update_available}")
+            
+            return self.update_available, None
+    
+    @contextlib.contextmanager
+    def _stop_git_on_shutdown(self, proc: subprocess.Popen, cmd: List[str], timeout: float) -> Iterator[None]:
+        """End a git process if it runs too long or the update checker is stopped.
         
-        # Get current commit hash for comparison
-        self.current_commit_hash = self.get_current_commit_hash()
-        if not self.current_commit_hash:
-            self.update_error = "Failed to get current commit hash"
-            return False, self.update_error
+        The process is killed once timeout seconds have passed, or terminated
+        as soon as stop_checker_thread() is called, so shutdown doesn't wait
+        for a slow fetch or pull.
+        
+        Args:
+            proc: Running git process
+            cmd: Command line the process was started with
+            timeout: Number of seconds to let the process run
             
-        # Check if we're using a fallback version (not a git repository)
-        if self.current_commit_hash.startswith("install-") or self.current_commit_hash == "unknown":
-            self.logger.info("Using non-git installation. Update checks disabled.")
-            self.update_available = False
-            return False, None
-        
-        # Get latest commit hash and version
-        result = self.get_latest_commit_hash()
-        if not result[0]:  # First element is commit hash
-            self.update_error = "Failed to get latest commit hash from GitHub"
-            return False, self.update_error
+        Raises:
+            subprocess.TimeoutExpired: If the process was killed for running too long
+            subprocess.SubprocessError: If the process was terminated for shutdown
+        """
+        done = threading.Event()
+        ended = []
+        
+        def watch():
+            deadline = time.monotonic() + timeout
+            while not done.wait(0.1):
+                if self.stop_event.is_set():
+                    ended.append("stopped")
+                    proc.terminate()
+                    return
+                if time.monotonic() >= deadline:
+                    ended.append("timeout")
+                    proc.kill()
+                    return
+        
+        watcher = threading.Thread(target=watch, name="GitWatcher", daemon=True)
+        watcher.start()
+        try:
+            yield
+        finally:
+            done.set()
+            watcher.join()
+        
+        if ended == ["timeout"]:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if ended == ["stopped"]:
+            raise subprocess.SubprocessError(f"{' '.join(cmd)} was stopped for shutdown")
+    
+    def _run_git(self, repo_dir: str, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run a git command and capture its output.
+        
+        Args:
+            repo_dir: Repository to run the command in
+            args: git arguments
+            timeout: Number of seconds to let the command run before killing it
+            
+        Returns:
+            subprocess.CompletedProcess: Exit status and decoded output
             
-        self.latest_commit_hash, self.latest_version = result
+        Raises:
+            subprocess.SubprocessError: If the command timed out or was stopped for shutdown
+        """
+        cmd = [self._git, '-C', repo_dir] + args
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+            with self._stop_git_on_shutdown(proc, cmd, timeout):
+                stdout, stderr = proc.communicate()
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+    
+    def _run_git_streaming(self, repo_dir: str, args: List[str], timeout: float, progress_callback=None,
+                           forward_stderr: bool = False) -> int:
+        """Run a git command, passing its output to the progress callback as it is written.
         
-        # Compare hashes
-        self.update_available = self.current_commit_hash != self.latest_commit_hash
+        Standard output goes to the callback a line at a time. Standard error
+        is sent once the command exits, as an error, if forward_stderr is set
+        and discarded otherwise. Without a callback the output isn't read at all.
         
-        # Log version information
-        self.logger.info(f"Current version: {self.current_version}")
-        if self.latest_version:
-            self.logger.info(f"Latest version available: {self.latest_version}")
-        self.logger.info(f"Update available: {self.update_available}")
+        Args:
+            repo_dir: Repository to run the command in
+            args: git arguments
+            timeout: Number of seconds to let the command run before killing it
+            progress_callback: Optional callback function to receive the output
+            forward_stderr: Whether to send standard error to the callback
+            
+        Returns:
+            int: The command's exit status
+            
+        Raises:
+            subprocess.SubprocessError: If the command timed out or was stopped for shutdown
+        """
+        cmd = [self._git, '-C', repo_dir] + args
+        if not progress_callback:
+            with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) as proc:
+                with self._stop_git_on_shutdown(proc, cmd, timeout):
+                    return proc.wait()
         
-        return self.update_available, None
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if forward_stderr else subprocess.DEVNULL,
+            text=True
+        ) as proc:
+            # Drain stderr alongside stdout so a full pipe can't stall git
+            stderr_lines = []
+            stderr_reader = None
+            if forward_stderr:
+                stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(proc.stderr), daemon=True)
+                stderr_reader.start()
+            
+            with self._stop_git_on_shutdown(proc, cmd, timeout):
+                for line in proc.stdout:
+                    progress_callback(line.rstrip('\n'))
+                returncode = proc.wait()
+            
+            if stderr_reader:
+                stderr_reader.join()
+        
+        if stderr_lines:
+            progress_callback(''.join(stderr_lines), is_error=True)
+        return returncode
     
     def update_application(self, progress_callback=None) -> Tuple[bool, Optional[str]]:
-        """Update the application using git pull.
+        """Update the application to the head of the remote main branch.
         
         Args:
             progress_callback: Optional callback function to receive real-time progress updates
@@ -179,139 +724,132 @@ class UpdateChecker:
         Returns:
             tuple: (success, error_message)
         """
-        # Check if we're using a fallback version (not a git repository)
-        if hasattr(self, 'current_commit_hash') and self.current_commit_hash:
-            if self.current_commit_hash.startswith("install-") or self.current_commit_hash == "unknown":
-                error_msg = "Cannot update: not a git repository installation."
-                self.logger.warning(error_msg)
-                if progress_callback:
-                    progress_callback(error_msg, is_error=True)
-                return False, error_msg
+        # Checks and updates share state and the repository, so run one at a time
+        with self._op_lock:
+            # Check if we're using a fallback version (not a git repository)
+            if hasattr(self, 'current_commit_hash') and self.current_commit_hash:
+                if self.current_commit_hash.startswith("install-") or self.current_commit_hash == "unknown":
+                    error_msg = "Cannot update: not a git repository installation."
+                    self.logger.warning(error_msg)
+                    if progress_callback:
+                        progress_callback(error_msg, is_error=True)
+                    return False, error_msg
 
-        try:
-            # Get expected git repository location (always at /opt/pulse)
-            repo_dir = '/opt/pulse'
-            if not os.path.exists(repo_dir):
-                # Fall back to try relative path resolution if not at standard location
-                repo_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
-            
-            # First check if we're in a git repository
-            if progress_callback:
-                progress_callback("Checking repository status...")
+            try:
+                # Get expected git repository location (always at /opt/pulse)
+                repo_dir = _get_repo_dir()
                 
-            repo_check = subprocess.run(
-                ['git', '-C', repo_dir, 'rev-parse', '--is-inside-work-tree'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            # If not a git repository, return error
-            if repo_check.returncode != 0:
-                error_msg = "Cannot update: not a git repository installation."
-                self.logger.warning(error_msg)
+                # First check if we're in a git repository
                 if progress_callback:
-                    progress_callback(error_msg, is_error=True)
-                return False, error_msg
-            
-            # Run git status to show current state
-            if progress_callback:
-                progress_callback("Checking for local changes...")
+                    progress_callback("Checking repository status...")
                 
-            status_result = subprocess.run(
-                ['git', '-C', repo_dir, 'status', '--short'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if status_result.stdout.strip():
-                if progress_callback:
-                    progress_callback("Local changes detected:\n" + status_result.stdout)
-            else:
-                if progress_callback:
-                    progress_callback("Working directory clean")
-            
-            # Run git fetch to get latest changes
-            if progress_callback:
-                progress_callback("Fetching latest changes from remote repository...")
+                # If not a git repository, or git can't be run, return error
+                if not self._git or not os.path.exists(os.path.join(repo_dir, '.git')):
+                    error_msg = "Cannot update: not a git repository installation."
+                    self.logger.warning(error_msg)
+                    if progress_callback:
+                        progress_callback(error_msg, is_error=True)
+                    return False, error_msg
                 
-            fetch_result = subprocess.run(
-                ['git', '-C', repo_dir, 'fetch'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if fetch_result.stdout:
+                # Run git status to show current state
                 if progress_callback:
-                    progress_callback(fetch_result.stdout)
-            
-            # Force update by resetting any local changes
-            if progress_callback:
-                progress_callback("Resetting local changes to ensure clean update...")
+                    progress_callback("Checking for local changes...")
+                    
+                status_result = self._run_git(repo_dir, ['status', '--short'], 10)
                 
-            reset_result = subprocess.run(
-                ['git', '-C', repo_dir, 'reset', '--hard', 'origin/main'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if reset_result.stdout:
-                if progress_callback:
-                    progress_callback(reset_result.stdout)
-            if reset_result.stderr:
+                if status_result.stdout.strip():
+                    if progress_callback:
+                        progress_callback("Local changes detected:\n" + status_result.stdout)
+                else:
+                    if progress_callback:
+                        progress_callback("Working directory clean")
+                
+                # Run git fetch to get latest changes; its errors, such as an
+                # authentication failure, are passed on to the callback
                 if progress_callback:
-                    progress_callback(reset_result.stderr, is_error=True)
-            
-            # Run git pull to update
-            if progress_callback:
-                progress_callback("Pulling latest changes...")
+                    progress_callback("Fetching latest changes from remote repository...")
+                    
+                if self._run_git_streaming(repo_dir, ['fetch', '--quiet'], 60, progress_callback, forward_stderr=True):
+                    error_msg = "Failed to fetch latest changes from remote repository"
+                    if progress_callback:
+                        progress_callback(error_msg, is_error=True)
+                    return False, error_msg
                 
-            result = subprocess.run(
-                ['git', '-C', repo_dir, 'pull', '--force'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            # Send output to callback
-            if progress_callback:
-                if result.stdout:
-                    progress_callback(result.stdout)
-                if result.stderr:
-                    progress_callback(result.stderr, is_error=True)
-            
-            # Check for merge conflicts
-            if "CONFLICT" in result.stdout or "CONFLICT" in result.stderr:
-                error_msg = "Merge conflict detected during update"
+                # Move to the fetched head, discarding any local changes. This
+                # is the whole update, so no git pull (and second fetch) follows.
                 if progress_callback:
-                    progress_callback(error_msg, is_error=True)
-                return False, error_msg
-            
-            # Check for authentication failure
-            if "Authentication failed" in result.stdout or "Authentication failed" in result.stderr:
-                error_msg = "Git authentication failed"
+                    progress_callback("Resetting to the latest changes...")
+                
+                previous_head = self.get_current_commit_hash()
+                if self._run_git_streaming(repo_dir, ['reset', '--hard', 'origin/main'], 30, progress_callback,
+                                           forward_stderr=True):
+                    error_msg = "Failed to reset to the latest changes"
+                    if progress_callback:
+                        progress_callback(error_msg, is_error=True)
+                    return False, error_msg
+                
+                # HEAD has moved; don't trust the mtime check on filesystems
+                # with coarse timestamps
+                self._head_mtimes = None
+                self._cached_head = None
+                
+                # Check if any changes were pulled
+                if self.get_current_commit_hash() == previous_head:
+                    if progress_callback:
+                        progress_callback("No changes to pull - already up to date")
+                else:
+                    if progress_callback:
+                        progress_callback("Update successful")
+                
+                return True, None
+            except subprocess.SubprocessError as e:
+                error_msg = f"Failed to update application: {e}"
+                self.logger.error(error_msg)
                 if progress_callback:
                     progress_callback(error_msg, is_error=True)
                 return False, error_msg
-            
-            # Check if any changes were pulled
-            if "Already up to date" in result.stdout:
-                if progress_callback:
-                    progress_callback("No changes to pull - already up to date")
+    
+    def _find_restart_executable(self) -> Optional[str]:
+        """Find the executable to start the application again with.
+        
+        Returns:
+            str: Path of the first existing executable file among the known
+                 install locations, or None if there is none
+        """
+        # Try multiple paths to find the executable
+        possible_paths = [
+            # Standard installation path
+            "/usr/local/bin/cybex-pulse",
+            # Legacy path in installation directory
+            os.path.join(_REPO_DIR_FALLBACK, "cybex-pulse"),
+            # Compatibility path
+            "/opt/cybex-pulse",
+            # Older versions used pulse filename
+            _PULSE_SCRIPT_FALLBACK,
+            # The pulse script in the root directory
+            "/opt/pulse/pulse",
+            # run_app.py as a last resort
+            "/opt/pulse/run_app.py"
+        ]
+        
+        # Log all possible paths (formatted only if debug logging is on)
+        self.logger.debug("Checking possible executable paths: %s", possible_paths)
+        
+        # Find the first existing executable, with one stat per path
+        for path in possible_paths:
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                self.logger.debug("Path does not exist: %s", path)
+                continue
+            if stat.S_ISREG(mode) and mode & 0o111:
+                self.logger.debug("Path is a file and is executable: %s", path)
+                return path
+            elif stat.S_ISDIR(mode):
+                self.logger.debug("Path is a directory, not a file: %s", path)
             else:
-                if progress_callback:
-                    progress_callback("Update successful")
-            
-            return True, None
-        except subprocess.SubprocessError as e:
-            error_msg = f"Failed to update application: {e}"
-            self.logger.error(error_msg)
-            if progress_callback:
-                progress_callback(error_msg, is_error=True)
-            return False, error_msg
+                self.logger.debug("Path exists but is not executable: %s", path)
+        return None
     
     def restart_application(self) -> None:
         """Restart the application.
@@ -319,152 +857,37 @@ class UpdateChecker:
         This function uses different methods based on the platform.
         """
         try:
-            # Enable more verbose logging
-            self.logger.setLevel(logging.DEBUG)
-            self.logger.debug("Starting restart process with detailed logging")
-            
-            # Try multiple paths to find the executable
-            possible_paths = [
-                # Standard installation path
-                "/usr/local/bin/cybex-pulse",
-                # Legacy path in installation directory
-                os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../cybex-pulse")),
-                # Compatibility path
-                "/opt/cybex-pulse",
-                # Older versions used pulse filename
-                os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../pulse"))
-            ]
+            self.logger.debug("Starting restart process")
             
-            # Log all possible paths
-            self.logger.debug(f"Checking possible executable paths: {possible_paths}")
-            
-            # Find the first existing executable
-            current_script = None
-            for path in possible_paths:
-                self.logger.debug(f"Checking path: {path}")
-                if os.path.exists(path):
-                    self.logger.debug(f"Path exists: {path}")
-                    # Check if it's a file (not a directory) and is executable
-                    if os.path.isfile(path) and os.access(path, os.X_OK):
-                        self.logger.debug(f"Path is a file and is executable: {path}")
-                        current_script = path
-                        break
-                    elif os.path.isdir(path):
-                        self.logger.debug(f"Path is a directory, not a file: {path}")
-                    elif not os.access(path, os.X_OK):
-                        self.logger.debug(f"Path exists but is not executable: {path}")
-                else:
-                    self.logger.debug(f"Path does not exist: {path}")
-            
-            # If no executable found in standard paths, check for the pulse script in the root directory
+            # Use the executable found at startup, looking again if there was none
+            current_script = self._restart_executable or self._find_restart_executable()
             if not current_script:
-                self.logger.debug("No executable found in standard paths, checking for pulse script")
-                pulse_script = "/opt/pulse/pulse"
-                self.logger.debug(f"Checking pulse script at: {pulse_script}")
-                
-                if os.path.exists(pulse_script):
-                    self.logger.debug(f"Pulse script exists at: {pulse_script}")
-                    # Check if it's a file and is executable
-                    if os.path.isfile(pulse_script) and os.access(pulse_script, os.X_OK):
-                        self.logger.debug(f"Pulse script is a file and is executable")
-                        current_script = pulse_script
-                        self.logger.info(f"Found pulse script at: {current_script}")
-                    elif os.path.isdir(pulse_script):
-                        self.logger.debug(f"Pulse script path is a directory, not a file")
-                    elif not os.access(pulse_script, os.X_OK):
-                        self.logger.debug(f"Pulse script exists but is not executable")
-                else:
-                    self.logger.debug(f"Pulse script does not exist at: {pulse_script}")
-                
-                # Try to find run_app.py as a fallback
-                if not current_script:
-                    run_app_script = "/opt/pulse/run_app.py"
-                    self.logger.debug(f"Checking run_app.py at: {run_app_script}")
-                    
-                    if os.path.exists(run_app_script):
-                        self.logger.debug(f"run_app.py exists at: {run_app_script}")
-                        # Check if it's a file and is executable
-                        if os.path.isfile(run_app_script) and os.access(run_app_script, os.X_OK):
-                            self.logger.debug(f"run_app.py is a file and is executable")
-                            current_script = run_app_script
-                            self.logger.info(f"Found run_app.py script at: {current_script}")
-                        elif os.path.isdir(run_app_script):
-                            self.logger.debug(f"run_app.py path is a directory, not a file")
-                        elif not os.access(run_app_script, os.X_OK):
-                            self.logger.debug(f"run_app.py exists but is not executable")
-                    else:
-                        self.logger.debug(f"run_app.py does not exist at: {run_app_script}")
-                
-                if not current_script:
-                    self.logger.error("Could not find application executable for restart")
-                    return
-                
-            # Determine platform and restart accordingly
-            system = platform.system().lower()
+                self.logger.error("Could not find application executable for restart")
+                return
+            
+            # Restart according to the platform
+            system = self._system
             
             if system == "linux" or system == "darwin":
                 # Use subprocess instead of execv to avoid permission issues
                 self.logger.info(f"Restarting application with: {current_script}")
+                
+                # Determine the correct execution method based on the script type
+                script_basename = os.path.basename(current_script)
+                interpreter = _RESTART_INTERPRETERS.get(script_basename, [])
+                cmd = interpreter + [current_script]
+                cwd = "/opt/pulse" if interpreter else None
+                self.logger.debug("Executing command: %s in directory: %s", cmd, cwd)
                 try:
-                    # Determine the correct execution method based on the script type
-                    script_basename = os.path.basename(current_script)
-                    self.logger.debug(f"Script basename: {script_basename}")
-                    
-                    # Use a direct approach with the full path to the script
-                    if script_basename == 'pulse':
-                        # For the pulse bash script
-                        self.logger.info("Executing pulse bash script directly")
-                        cmd = ["/bin/bash", current_script]
-                        self.logger.debug(f"Executing command: {cmd} in directory: /opt/pulse")
-                        try:
-                            # Use Popen to start the process without waiting
-                            self.logger.debug("Starting process with Popen")
-                            subprocess.Popen(cmd, cwd="/opt/pulse", close_fds=True)
-                            
-                            # Log success and exit this process
-                            self.logger.info("Successfully started new process, exiting current process")
-                            os._exit(0)
-                        except Exception as e:
-                            self.logger.error(f"Error executing pulse script: {e}")
-                    elif script_basename == 'run_app.py':
-                        # For the Python script
-                        self.logger.info("Executing Python script directly")
-                        cmd = ["/usr/bin/python3", current_script]
-                        self.logger.debug(f"Executing command: {cmd} in directory: /opt/pulse")
-                        try:
-                            # Use Popen to start the process without waiting
-                            self.logger.debug("Starting process with Popen")
-                            subprocess.Popen(cmd, cwd="/opt/pulse", close_fds=True)
-                            
-                            # Log success and exit this process
-                            self.logger.info("Successfully started new process, exiting current process")
-                            os._exit(0)
-                        except Exception as e:
-                            self.logger.error(f"Error executing Python script: {e}")
-                    else:
-                        # For other executables
-                        self.logger.info("Executing application binary directly")
-                        cmd = [current_script]
-                        self.logger.debug(f"Executing command: {cmd}")
-                        try:
-                            # Use Popen to start the process without waiting
-                            self.logger.debug("Starting process with Popen")
-                            subprocess.Popen(cmd, close_fds=True)
-                            
-                            # Log success and exit this process
-                            self.logger.info("Successfully started new process, exiting current process")
-                            os._exit(0)
-                        except Exception as e:
-                            self.logger.error(f"Error executing binary: {e}")
-                    
-                    # Exit the current process
-                    self.logger.info("Exiting current process to complete restart")
-                    os._exit(0)
-                except subprocess.SubprocessError as e:
-                    self.logger.error(f"Failed to restart using subprocess: {e}")
-                    # Fall back to execv as a last resort
-                    self.logger.info("Falling back to execv for restart")
-                    os.execv(current_script, [current_script])
+                    # Use Popen to start the process without waiting
+                    subprocess.Popen(cmd, cwd=cwd, close_fds=True)
+                    self.logger.info("Successfully started new process, exiting current process")
+                except Exception as e:
+                    self.logger.error(f"Error executing {script_basename}: {e}")
+                
+                # Exit the current process
+                self.logger.info("Exiting current process to complete restart")
+                os._exit(0)
             elif system == "windows":
                 # Use subprocess on Windows
                 self.logger.info(f"Restarting application with: {current_script}")
@@ -494,44 +917,69 @@ class UpdateChecker:
         self.thread.start()
     
     def stop_checker_thread(self) -> None:
-        """Stop the update checker thread."""
-        if not self.thread or not self.thread.is_alive():
-            return
+        """Stop the update checker thread and close its pooled connections."""
+        if self.thread and self.thread.is_alive():
+            self.logger.info("Stopping update checker thread")
+            self.stop_event.set()
+            self.thread.join(timeout=1.0)
+            self.thread = None
         
-        self.logger.info("Stopping update checker thread")
-        self.stop_event.set()
-        self.thread.join(timeout=1.0)
-        self.thread = None
+        if self._session is not None:
+            self._session.close()
     
     def _run_update_checker(self) -> None:
         """Run the update checker in a loop."""
         self.logger.info("Update checker thread started")
         
         # Initial check
-        self.check_for_updates()
+        self.check_for_updates(force=True)
+        
+        # A non-git installation can't become one without a restart, so
+        # there's nothing to check for until then
+        if self.current_commit_hash and (self.current_commit_hash.startswith("install-")
+                                         or self.current_commit_hash == "unknown"):
+            self.logger.info("Not a git repository installation, stopping update checker thread")
+            return
         
         while not self.stop_event.is_set():
             try:
-                # Sleep for interval
-                self._sleep_with_check(self.check_interval)
+                # Sleep for interval, or longer after failures or while GitHub is rate limiting us
+                self._sleep_with_check(self._next_check_delay())
                 
                 # Skip if thread should stop
                 if self.stop_event.is_set():
                     break
                 
-                # Check for updates
-                self.check_for_updates()
+                # Check for updates, unless an update is being applied
+                if self._op_lock.locked():
+                    self.logger.info("Update in progress, skipping periodic check")
+                    continue
+                self.check_for_updates(force=True)
+                if self.stop_event.is_set():
+                    break
             except Exception as e:
                 self.logger.error(f"Error in update checker: {e}")
                 self._sleep_with_check(60)
     
+    def _next_check_delay(self) -> float:
+        """Get the number of seconds to wait before the next periodic check.
+        
+        The check interval doubles with each consecutive failed check, up to
+        _MAX_CHECK_BACKOFF seconds, and is stretched to the end of any rate
+        limit GitHub has reported.
+        
+        Returns:
+            float: Seconds to wait
+        """
+        delay = self.check_interval
+        if self._consecutive_failures:
+            delay = max(delay, min(delay * 2 ** self._consecutive_failures, _MAX_CHECK_BACKOFF))
+        return max(delay, self._rate_limit_delay())
+    
     def _sleep_with_check(self, seconds: int) -> None:
-        """Sleep for specified seconds while periodically checking stop event.
+        """Sleep for specified seconds, returning early if the stop event is set.
         
         Args:
             seconds: Number of seconds to sleep
         """
-        for _ in range(seconds):
-            if self.stop_event.is_set():
-                break
-            time.sleep(1)
\ No newline at end of file
+        self.stop_event.wait(timeout=seconds)
\ No newline at end of file
@@ -63,7 +63,7 @@ class VersionManager:
         if not self.version_file.exists():
             # If the file doesn't exist, create it with default values
             self.version = "0.1.0"
-            self.last_modified = time.time()
+            self.last_modified = time.time_ns()
             self._save_version_info()
             return
         
@@ -71,12 +71,12 @@ class VersionManager:
             with open(self.version_file, 'r') as f:
                 # The VERSION file contains just the version string
                 self.version = f.read().strip()
-                self.last_modified = self.version_file.stat().st_mtime
+                self.last_modified = self.version_file.stat().st_mtime_ns
         except IOError as e:
             logger.error(f"Error loading version file: {e}")
             # Use default values
             self.version = "0.1.0"
-            self.last_modified = time.time()
+            self.last_modified = time.time_ns()
             self._save_version_info()
     
     def _save_version_info(self) -> None:
@@ -85,7 +85,7 @@ class VersionManager:
             with open(self.version_file, 'w') as f:
                 # Just write the version string to the file
                 f.write(self.version)
-            self.last_modified = time.time()
+            self.last_modified = time.time_ns()
         except IOError as e:
             logger.error(f"Error saving version file: {e}")
     
@@ -163,7 +163,7 @@ class VersionManager:
         
         # Update the version and last modified time
         self.version = '.'.join(version_parts)
-        self.last_modified = time.time()
+        self.last_modified = time.time_ns()
     
     def is_development_version(self) -> bool:
         """Check if this is a development version.
@@ -177,11 +177,14 @@ class VersionManager:
         
         return '-dev' in self.version
     
-    def get_last_modified(self) -> float:
+    def get_last_modified(self) -> int:
         """Get the timestamp of the last version update.
         
+        The value is kept as integer nanoseconds (``st_mtime_ns``) so it can
+        be compared exactly; divide by 1e9 only when rendering a date.
+        
         Returns:
-            float: Timestamp of the last version update
+            int: Timestamp of the last version update in nanoseconds since the epoch
         """
         # Ensure version is determined
         if self.last_modified is None:
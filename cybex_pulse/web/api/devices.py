@@ -85,8 +85,7 @@ def register_device_routes(app, server):
         vendor = server.request.args.get('vendor', '')
         device_name = server.request.args.get('device_name', '')
         
-        from cybex_pulse.utils.icon_mapper import IconMapper
-        icon_mapper = IconMapper()
-        icon_html = icon_mapper.get_icon_html(vendor, device_name)
+        from cybex_pulse.utils.icon_mapper import get_icon_html
+        icon_html = get_icon_html(vendor, device_name)
         
         return icon_html
\ No newline at end of file
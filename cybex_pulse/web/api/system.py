@@ -2,16 +2,10 @@
 System information API endpoints.
 """
 import logging
-import time
-from cybex_pulse.utils.system_info import get_all_system_info, get_cpu_info, get_memory_info, get_disk_info
+from cybex_pulse.utils.system_info import get_all_system_info_json, get_cpu_info, get_memory_info, get_disk_info
 
 logger = logging.getLogger("cybex_pulse.api.system")
 
-# Cache system information to reduce load
-_system_info_cache = {}
-_last_update_time = 0
-_CACHE_TTL = 2  # Cache TTL in seconds
-
 def register_system_api(app, server):
     """Register system API endpoints with the Flask application.
     
@@ -28,24 +22,10 @@ def register_system_api(app, server):
         Returns:
             JSON response with system information
         """
-        global _system_info_cache, _last_update_time
-        
         try:
-            current_time = time.time()
-            
-            # Check if we have a recent cache
-            if current_time - _last_update_time <= _CACHE_TTL and _system_info_cache:
-                return server.jsonify(_system_info_cache)
-            
-            # Get system information
-            system_info = get_all_system_info()
-            
-            # Update cache
-            _system_info_cache = system_info
-            _last_update_time = current_time
-            
-            # Return as JSON
-            return server.jsonify(system_info)
+            # System information is cached and rendered to JSON once per
+            # cache window, so repeated polls return the same string
+            return server.Response(get_all_system_info_json(), mimetype='application/json')
         except Exception as e:
             logger.error(f"Error getting system information: {str(e)}")
             return server.jsonify({
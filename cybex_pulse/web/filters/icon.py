@@ -1,7 +1,7 @@
 """
 Icon related filters for templates.
 """
-from cybex_pulse.utils.icon_mapper import IconMapper
+from cybex_pulse.utils.icon_mapper import get_icon_html
 
 
 def device_icon(vendor, device_name=None):
@@ -14,5 +14,4 @@ def device_icon(vendor, device_name=None):
     Returns:
         str: HTML for the appropriate icon
     """
-    icon_mapper = IconMapper()
-    return icon_mapper.get_icon_html(vendor, device_name)
\ No newline at end of file
+    return get_icon_html(vendor, device_name)
\ No newline at end of file
@@ -13,7 +13,7 @@ import time
 import threading
 from flask import Response, stream_with_context
 from cybex_pulse.utils.system_info import get_all_system_info
-from cybex_pulse.utils.async_logging import ThreadSafeConsoleStreamHandler
+from cybex_pulse.utils.async_logging import ThreadSafeConsoleStreamHandler, CONSOLE_TIMESTAMP_FORMAT
 
 # Constants for console configuration
 MAX_QUEUE_SIZE = 1000  # Maximum number of messages in queue
@@ -124,7 +124,8 @@ def setup_console_resources():
     # Set up logging handler
     console_handler = ConsoleStreamHandler(message_queue)
     console_handler.setLevel(LOG_LEVEL)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    # Render asctime in the console timestamp format so the handler can reuse it
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=CONSOLE_TIMESTAMP_FORMAT))
     
     # Add handler to root logger
     root_logger = logging.getLogger()
@@ -33,7 +33,7 @@ def register_dashboard_routes(app, server):
         version_last_modified = None
         if hasattr(server, 'version_last_modified') and server.version_last_modified:
             from datetime import datetime
-            version_last_modified = datetime.fromtimestamp(server.version_last_modified).strftime('%Y-%m-%d %H:%M:%S')
+            version_last_modified = datetime.fromtimestamp(server.version_last_modified / 1e9).strftime('%Y-%m-%d %H:%M:%S')
             
         return {
             'config_obj': server.config,
@@ -327,6 +327,9 @@ def process_setup_step(server, step: int) -> None:
         security = server.config.get("monitoring", "security", {})
         security["enabled"] = enable_security
         server.config.set("monitoring", "security", security)
+    
+    # Write all of this step's changes in one go
+    server.config.flush()
 
 
 def update_settings_from_form(server, form: Dict[str, str]) -> None:
@@ -488,6 +491,9 @@ def update_settings_from_form(server, form: Dict[str, str]) -> None:
         # Hash the password
         password_hash = hashlib.sha256(web_password.encode()).hexdigest()
         server.config.set("web_interface", "password_hash", password_hash)
+    
+    # Write all settings changes in one go
+    server.config.flush()
         
     # Update monitoring threads if settings have changed and the main_app reference exists
     if server.main_app:
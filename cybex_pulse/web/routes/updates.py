@@ -37,7 +37,7 @@ def register_update_routes(app, server):
         if not server.main_app:
             return server.jsonify({"error": "Main application not available"}), 500
             
-        # Force check for updates
+        # Check for updates, reusing a result from the last minute
         update_available, error = server.main_app.update_checker.check_for_updates()
         
         if error:
@@ -329,8 +329,8 @@ install_system_packages() {
     find_python_command() {
         log_info "Detecting Python installation..."
         
-        # Check for Python 3.7+ first (as the minimum required version)
-        for cmd in python3.11 python3.10 python3.9 python3.8 python3.7 python3 python; do
+        # Check for Python 3.8+ first (as the minimum required version)
+        for cmd in python3.11 python3.10 python3.9 python3.8 python3 python; do
             if command -v $cmd &> /dev/null; then
                 # Check version
                 ver=$($cmd -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")' 2>/dev/null)
@@ -338,19 +338,19 @@ install_system_packages() {
                     major=$(echo $ver | cut -d. -f1)
                     minor=$(echo $ver | cut -d. -f2)
                     
-                    if [ "$major" -eq 3 ] && [ "$minor" -ge 7 ]; then
+                    if [ "$major" -eq 3 ] && [ "$minor" -ge 8 ]; then
                         PYTHON_CMD=$cmd
                         log_success "Found suitable Python: $PYTHON_CMD (version $ver)"
                         echo "Python version: $($PYTHON_CMD --version)" >> $LOG_FILE 2>&1
                         return 0
                     else
-                        log_warning "Found Python $cmd but version $ver is too old (need 3.7+)"
+                        log_warning "Found Python $cmd but version $ver is too old (need 3.8+)"
                     fi
                 fi
             fi
         done
         
-        log_error "No suitable Python installation found. Need Python 3.7 or newer."
+        log_error "No suitable Python installation found. Need Python 3.8 or newer."
         return 1
     }
     
@@ -375,10 +375,10 @@ install_system_packages() {
                 $SUDO_CMD zypper --non-interactive install python3 python3-pip >> $LOG_FILE 2>&1
                 ;;
             *)
-                log_error "Cannot install Python automatically on this system. Please install Python 3.7+ manually." "fatal"
+                log_error "Cannot install Python automatically on this system. Please install Python 3.8+ manually." "fatal"
                 ;;
         esac
-        find_python_command || log_error "Failed to install Python. Please install Python 3.7+ manually." "fatal"
+        find_python_command || log_error "Failed to install Python. Please install Python 3.8+ manually." "fatal"
     }
     
     # Check if we have any missing packages